@@ -1,6 +1,7 @@
 from . import consts
 from .configs import FacetingConfig
 from .figure_manager import FigureManager
+from .figure_saver import FigureSaver
 from .utils import (
     convert_cli_value_to_type,
     parse_key_value_args,
@@ -12,6 +13,7 @@ __version__ = "0.1.0"
 __all__ = [
     "FacetingConfig",
     "FigureManager",
+    "FigureSaver",
     "consts",
     "convert_cli_value_to_type",
     "parse_key_value_args",
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from typing import Any
+
+from dr_plotter.configs import LayoutConfig
+from dr_plotter.utils import parse_scale_pair
+
+
+def apply_cell_layout(ax: Any, layout: LayoutConfig, row: int, col: int) -> None:
+    for labels, setter in [
+        (layout.x_labels, ax.set_xlabel),
+        (layout.y_labels, ax.set_ylabel),
+    ]:
+        if labels is not None and row < len(labels) and col < len(labels[row]):
+            setter(labels[row][col] or "")
+
+    scale_pair = layout.xyscale
+    if isinstance(scale_pair, list):
+        in_grid = row < len(scale_pair) and col < len(scale_pair[row])
+        scale_pair = scale_pair[row][col] if in_grid else None
+    if scale_pair is not None:
+        x_scale, y_scale = parse_scale_pair(scale_pair)
+        ax.set_xscale(x_scale)
+        ax.set_yscale(y_scale)
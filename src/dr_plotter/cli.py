@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+import time
 from pathlib import Path
 from typing import Any
 
 import click
 
 from dr_plotter import FigureManager
+from dr_plotter.figure_saver import FigureSaver
 from dr_plotter.scripting import (
     CLIWorkflowConfig,
     dimensional_plotting_cli,
     execute_cli_workflow,
     load_dataset,
+    read_dataset_columns,
 )
+from dr_plotter.scripting.batch import load_manifest, run_batch, validate_spec
 from dr_plotter.scripting.utils import show_or_save_plot
 from dr_plotter.theme import BASE_THEME, FigureStyles, Theme
 
@@ -30,7 +34,24 @@ CLI_THEME = Theme(
 )
 
 
-@click.command()
+class DefaultPlotGroup(click.Group):
+    # Bare `dr-plotter DATASET ...` invocations keep working as `plot`.
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        if (
+            args
+            and args[0] not in self.commands
+            and args[0] not in ctx.help_option_names
+        ):
+            args = ["plot", *args]
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=DefaultPlotGroup)
+def main() -> None:
+    pass
+
+
+@main.command("plot", help="Plot a parquet dataset")
 @click.argument("dataset_path", type=click.Path())
 @click.option(
     "--x",
@@ -44,29 +65,78 @@ CLI_THEME = Theme(
     default="scatter",
     help="Type of plot to create (default: scatter)",
 )
+@click.option(
+    "--page-size",
+    type=(int, int),
+    default=None,
+    help="Emit wrap_by facets as pages of ROWS COLS panels, one figure at a time",
+)
 @dimensional_plotting_cli(skip_fields={"x", "y"})
-def main(
+def plot(
     dataset_path: str,
     x: str,
     y: str,
     plot_type: str,
+    page_size: tuple[int, int] | None,
     **kwargs: Any,
 ) -> None:
     df, plot_config = execute_cli_workflow(
-        kwargs,
+        {**kwargs, "x": x, "y": y},
         CLIWorkflowConfig(
-            data_loader=lambda _: load_dataset(dataset_path),
+            data_loader=lambda args: load_dataset(
+                dataset_path, args["faceting"], args["columns"]
+            ),
+            schema_loader=lambda _: read_dataset_columns(dataset_path),
             allowed_unused={"save_dir", "pause"},
         ),
     )
+    filename = f"dr_plotter_{Path(dataset_path).stem}"
+    if page_size is not None:
+        pages = FigureManager.iter_pages(df, plot_type, page_size, plot_config)
+        with FigureSaver() as saver:
+            for page_num, fm in enumerate(pages):
+                show_or_save_plot(
+                    fm.fig,
+                    kwargs["save_dir"],
+                    kwargs["pause"],
+                    f"{filename}_page{page_num:03d}",
+                    saver,
+                )
+        return
+
     with FigureManager(plot_config) as fm:
         fm.plot(df, plot_type)
-    show_or_save_plot(
-        fm.fig,
-        kwargs["save_dir"],
-        kwargs["pause"],
-        f"dr_plotter_{Path(dataset_path).stem}",
+    show_or_save_plot(fm.fig, kwargs["save_dir"], kwargs["pause"], filename)
+
+
+@main.command("batch", help="Render every plot in a YAML manifest in parallel")
+@click.argument("manifest_path", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Number of worker processes (default: one per CPU)",
+)
+def batch(manifest_path: str, workers: int | None) -> None:
+    specs = load_manifest(manifest_path)
+    for spec in specs:
+        validate_spec(spec)
+
+    start = time.perf_counter()
+    results = run_batch(specs, workers)
+    elapsed = time.perf_counter() - start
+
+    name_width = max(len("plot"), *(len(result.name) for result in results))
+    click.echo(
+        f"{'plot':<{name_width}}  {'load':>7}  {'plot':>7}  {'save':>7}  {'total':>7}"
     )
+    for result in results:
+        click.echo(
+            f"{result.name:<{name_width}}  {result.load_seconds:>6.2f}s"
+            f"  {result.plot_seconds:>6.2f}s  {result.save_seconds:>6.2f}s"
+            f"  {result.total_seconds:>6.2f}s"
+        )
+    click.echo(f"Rendered {len(results)} plots in {elapsed:.2f}s")
 
 
 if __name__ == "__main__":
@@ -27,6 +27,12 @@ class CycleConfig:
         for channel, cycle in self._cycles.items():
             assert cycle is not None, f"Missing cycle for channel '{channel}'"
 
+    def export_assignments(self) -> dict[StyleCacheKey, Any]:
+        return dict(self._value_assignments)
+
+    def load_assignments(self, assignments: dict[StyleCacheKey, Any]) -> None:
+        self._value_assignments.update(assignments)
+
     def get_styled_value_for_channel(
         self, channel: VisualChannel, value: Any
     ) -> dict[StyleAttrName, Any]:
@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+SHARE_SCOPES = {"all", "row", "col", "none"}
+
 
 @dataclass
 class FacetingConfig:
@@ -42,6 +44,9 @@ class FacetingConfig:
     exterior_x_label: str | None = None
     exterior_y_label: str | None = None
 
+    share_x: str | None = None
+    share_y: str | None = None
+
     target_row: int | None = None
     target_col: int | None = None
 
@@ -53,6 +58,11 @@ class FacetingConfig:
     def validate(self) -> None:
         assert self.x is not None, "x parameter is required for faceting"
         assert self.y is not None, "y parameter is required for faceting"
+        for name in ("share_x", "share_y"):
+            scope = getattr(self, name)
+            assert scope is None or scope in SHARE_SCOPES, (
+                f"{name} must be one of {sorted(SHARE_SCOPES)}, got '{scope}'"
+            )
 
     @classmethod
     def from_input(
@@ -27,6 +27,7 @@ class LayoutConfig:
     figsize: tuple[float, float] = (12.0, 8.0)
     tight_layout: bool = True
     constrained_layout: bool = False
+    fast_layout: bool = False
 
     tight_layout_pad: float = 0.5
     tight_layout_rect: tuple[float, float, float, float] | None = None
@@ -49,6 +50,9 @@ class LayoutConfig:
         assert not (self.constrained_layout and self.tight_layout), (
             "Only one of constrained_layout or tight_layout can be True"
         )
+        assert not (self.constrained_layout and self.fast_layout), (
+            "Only one of constrained_layout or fast_layout can be True"
+        )
 
         if self.xyscale is not None:
             self._validate_xyscale()
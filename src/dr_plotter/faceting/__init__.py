@@ -1,9 +1,15 @@
+from .dimensional_utils import register_unit_suffix
+from .facet_index import FacetIndex
+from .facet_plan import FacetPlan
 from .faceting_core import prepare_faceted_subplots
 from .layout_utils import get_grid_dimensions
 from .style_coordination import FacetStyleCoordinator
 
 __all__ = [
+    "FacetIndex",
+    "FacetPlan",
     "FacetStyleCoordinator",
     "get_grid_dimensions",
     "prepare_faceted_subplots",
+    "register_unit_suffix",
 ]
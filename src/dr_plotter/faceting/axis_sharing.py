@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+import matplotlib as mpl
+import numpy as np
+import pandas as pd
+from matplotlib.ticker import FixedLocator, Locator
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+Cell = tuple[int, int]
+Extent = tuple[float, float]
+
+
+class SharedTickLocator(FixedLocator):
+    # Remembers the locator it replaced so the ticks can be recomputed when
+    # the shared limits change.
+    def __init__(self, locs: np.ndarray, source: Locator) -> None:
+        super().__init__(locs)
+        self.source = source
+
+
+def data_extent(data: pd.DataFrame, columns: list[str]) -> Extent | None:
+    lows, highs = [], []
+    for column in columns:
+        if column not in data.columns:
+            return None
+        series = data[column]
+        if is_bool_dtype(series) or not is_numeric_dtype(series):
+            return None
+        values = series.to_numpy(dtype=float, na_value=np.nan)
+        finite = values[np.isfinite(values)]
+        if finite.size:
+            lows.append(finite.min())
+            highs.append(finite.max())
+    if not lows:
+        return None
+    return float(min(lows)), float(max(highs))
+
+
+def merge_extents(extents: Iterable[Extent | None]) -> Extent | None:
+    present = [extent for extent in extents if extent is not None]
+    if not present:
+        return None
+    return min(low for low, _ in present), max(high for _, high in present)
+
+
+def shared_extents(
+    extents: dict[Cell, Extent | None], scope: str
+) -> dict[Cell, Extent]:
+    groups: dict[Any, list[Extent | None]] = {}
+    for cell, extent in extents.items():
+        groups.setdefault(share_key(cell, scope), []).append(extent)
+    merged = {key: merge_extents(group) for key, group in groups.items()}
+    return {
+        cell: merged[share_key(cell, scope)]
+        for cell in extents
+        if merged[share_key(cell, scope)] is not None
+    }
+
+
+def share_key(cell: Cell, scope: str) -> Any:
+    row, col = cell
+    return {"all": 0, "row": row, "col": col, "none": cell}[scope]
+
+
+def apply_extent(axis: Any, extent: Extent) -> None:
+    # Mirrors autoscale_view for artists drawn at their data values: margins
+    # are added in scale space, then limits and ticks are fixed in one go.
+    locator = axis.get_major_locator()
+    if isinstance(locator, SharedTickLocator):
+        locator = locator.source
+    low, high = locator.nonsingular(*extent)
+    low, high = axis.limit_range_for_scale(low, high)
+
+    # Margins stop at sticky edges (e.g. the baseline of bars).
+    stickies = _sticky_edges(axis)
+    low_bound = high_bound = None
+    if len(stickies):
+        tol = 1e-5 * abs(high - low)
+        below = stickies.searchsorted(low + tol) - 1
+        low_bound = stickies[below] if below != -1 else None
+        above = stickies.searchsorted(high - tol)
+        high_bound = stickies[above] if above != len(stickies) else None
+
+    margin = axis.axes.margins()[0 if axis.axis_name == "x" else 1]
+    transform = axis.get_transform()
+    scaled_low, scaled_high = transform.transform([low, high])
+    delta = (scaled_high - scaled_low) * margin
+    low, high = transform.inverted().transform(
+        [scaled_low - delta, scaled_high + delta]
+    )
+    if low_bound is not None:
+        low = max(low, low_bound)
+    if high_bound is not None:
+        high = min(high, high_bound)
+    if mpl.rcParams["axes.autolimit_mode"] == "round_numbers":
+        low, high = locator.view_limits(low, high)
+
+    ticks = np.asarray(locator.tick_values(low, high))
+    tolerance = (high - low) * 1e-10
+    ticks = ticks[(ticks >= low - tolerance) & (ticks <= high + tolerance)]
+    axis.set_major_locator(SharedTickLocator(ticks, locator))
+    set_limits = axis.axes.set_xlim if axis.axis_name == "x" else axis.axes.set_ylim
+    set_limits(low, high, auto=False)
+
+
+def _sticky_edges(axis: Any) -> np.ndarray:
+    ax = axis.axes
+    if not ax.use_sticky_edges:
+        return np.array([])
+    shared = ax.get_shared_x_axes() if axis.axis_name == "x" else ax.get_shared_y_axes()
+    stickies = np.sort(
+        [
+            edge
+            for sibling in shared.get_siblings(ax)
+            for artist in sibling.get_children()
+            for edge in getattr(artist.sticky_edges, axis.axis_name)
+        ]
+    )
+    if axis.get_scale() == "log":
+        stickies = stickies[stickies > 0]
+    return stickies
@@ -1,36 +1,89 @@
 from __future__ import annotations
 
+import functools
 import re
+from collections.abc import Sequence
 from typing import Any
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from dr_plotter.configs import FacetingConfig
 
 
+SMART_SORT_PATTERN = r"^(?P<number>\d+(?:\.\d+)?)(?P<unit>[A-Za-z]*)$"
+ASCII_WHITESPACE = " \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+UNIT_MULTIPLIERS: dict[str, float] = {
+    "K": 1e3,
+    "M": 1e6,
+    "B": 1e9,
+    "T": 1e12,
+    "KB": 1e3,
+    "MB": 1e6,
+    "GB": 1e9,
+    "TB": 1e12,
+}
+SORT_CACHE_SIZE = 128
+
+
+def register_unit_suffix(suffix: str, multiplier: float) -> None:
+    assert suffix.isalpha(), f"Unit suffix must be alphabetic, got '{suffix}'"
+    UNIT_MULTIPLIERS[suffix.upper()] = float(multiplier)
+    _cached_sort_order.cache_clear()
+
+
 def smart_sort_key(value: Any) -> tuple[float, str]:
     str_value = str(value)
-    match = re.match(r"^(\d+(?:\.\d+)?)([A-Za-z]*)$", str_value.strip())
+    match = re.match(SMART_SORT_PATTERN, str_value.strip())
     if match:
         numeric_part = float(match.group(1))
         unit_part = match.group(2).upper()
-        unit_multipliers = {
-            "K": 1e3,
-            "M": 1e6,
-            "B": 1e9,
-            "T": 1e12,
-            "KB": 1e3,
-            "MB": 1e6,
-            "GB": 1e9,
-            "TB": 1e12,
-        }
-        multiplier = unit_multipliers.get(unit_part, 1)
+        multiplier = UNIT_MULTIPLIERS.get(unit_part, 1)
         return (numeric_part * multiplier, str_value)
     return (float("inf"), str_value)
 
 
-def smart_sort_values(values: list[Any]) -> list[Any]:
-    return sorted(values, key=smart_sort_key)
+def smart_sort_values(values: Sequence[Any], column: str | None = None) -> list[Any]:
+    values = list(values)
+    order = _cached_sort_order(column, tuple(str(v) for v in values))
+    return [values[i] for i in order]
+
+
+@functools.lru_cache(maxsize=SORT_CACHE_SIZE)
+def _cached_sort_order(
+    column: str | None,
+    str_values: tuple[str, ...],
+) -> tuple[int, ...]:
+    if not str_values:
+        return ()
+    strings = pa.array(str_values, type=pa.string())
+    stripped = pc.utf8_trim(strings, characters=ASCII_WHITESPACE)
+    parts = pc.extract_regex(stripped, pattern=SMART_SORT_PATTERN)
+    numbers = pc.cast(pc.struct_field(parts, "number"), pa.float64())
+    unit_positions = pc.index_in(
+        pc.utf8_upper(pc.struct_field(parts, "unit")),
+        value_set=pa.array(list(UNIT_MULTIPLIERS.keys()), type=pa.string()),
+    )
+    multipliers = pc.take(
+        pa.array(list(UNIT_MULTIPLIERS.values()), type=pa.float64()),
+        unit_positions,
+    )
+    sort_numbers = np.array(
+        pc.fill_null(pc.multiply(numbers, pc.fill_null(multipliers, 1.0)), np.inf)
+    )
+
+    # Arrow regexes are ASCII-only; defer non-ASCII values to the scalar key.
+    is_ascii = np.array(pc.string_is_ascii(strings))
+    for i in np.flatnonzero(~is_ascii):
+        sort_numbers[i] = smart_sort_key(str_values[i])[0]
+
+    order = pc.sort_indices(
+        pa.table({"number": sort_numbers, "string": strings}),
+        sort_keys=[("number", "ascending"), ("string", "ascending")],
+    )
+    return tuple(order.to_pylist())
 
 
 def apply_dimensional_filters(
@@ -53,13 +106,23 @@ def resolve_dimension_values(
     data: pd.DataFrame,
     dim: str,
     config: FacetingConfig,
+) -> list[str]:
+    if _has_explicit_values(dim, config):
+        return resolve_values_from_uniques([], dim, config)
+    return resolve_values_from_uniques(data[dim].unique(), dim, config)
+
+
+def resolve_values_from_uniques(
+    unique_values: Sequence[Any],
+    dim: str,
+    config: FacetingConfig,
 ) -> list[str]:
     if getattr(config, "fixed", None) and dim in config.fixed:
         return [config.fixed[dim]]
     vals = (
         config.order[dim]
         if getattr(config, "order", None) and dim in config.order
-        else smart_sort_values(data[dim].unique())
+        else smart_sort_values(unique_values, column=dim)
     )
     if getattr(config, "exclude", None) and dim in config.exclude:
         exclude_set = set(config.exclude[dim])
@@ -67,6 +130,13 @@ def resolve_dimension_values(
     return vals
 
 
+def _has_explicit_values(dim: str, config: FacetingConfig) -> bool:
+    return bool(
+        (getattr(config, "fixed", None) and dim in config.fixed)
+        or (getattr(config, "order", None) and dim in config.order)
+    )
+
+
 def generate_dimensional_title(config: FacetingConfig) -> str:
     if config.fixed:
         return " ".join(f"{k}={v}" for k, v in config.fixed.items())
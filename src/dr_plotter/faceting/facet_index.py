@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from dr_plotter.configs import FacetingConfig
+from dr_plotter.faceting.dimensional_utils import resolve_values_from_uniques
+
+
+class FacetIndex:
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        config: FacetingConfig,
+        dimensions: list[str | None] | None = None,
+    ) -> None:
+        self.config = config
+        self.n_rows = len(data)
+        self._values: dict[str, list[Any]] = {}
+        self._codes: dict[str, np.ndarray] = {}
+
+        if dimensions is None:
+            dimensions = self.referenced_dimensions(config)
+        for dim in dimensions:
+            if dim and dim not in self._values:
+                self._index_dimension(data, dim)
+
+    @staticmethod
+    def referenced_dimensions(config: FacetingConfig) -> list[str]:
+        dimensions = [
+            config.rows_by,
+            config.cols_by,
+            config.wrap_by,
+            config.hue_by,
+            config.alpha_by,
+            config.size_by,
+            config.marker_by,
+            config.style_by,
+        ]
+        return [dim for dim in dimensions if dim]
+
+    def __contains__(self, dim: str) -> bool:
+        return dim in self._values
+
+    def values(self, dim: str) -> list[Any]:
+        assert dim in self._values, f"Dimension '{dim}' is not indexed"
+        return self._values[dim]
+
+    def codes(self, dim: str) -> np.ndarray:
+        assert dim in self._codes, f"Dimension '{dim}' is not indexed"
+        return self._codes[dim]
+
+    def _index_dimension(self, data: pd.DataFrame, dim: str) -> None:
+        column = data[dim]
+        codes, uniques = pd.factorize(column, use_na_sentinel=True)
+        unique_values = list(uniques)
+        missing = codes < 0
+        if missing.any():
+            unique_values.append(column[missing].iloc[0])
+
+        values = resolve_values_from_uniques(unique_values, dim, self.config)
+        positions: dict[Any, int] = {}
+        for position, value in enumerate(values):
+            positions.setdefault(value, position)
+        lookup = np.array([positions.get(u, -1) for u in uniques] + [-1], dtype=np.intp)
+
+        self._values[dim] = values
+        self._codes[dim] = lookup[codes]
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+import pandas as pd
+
+from dr_plotter.configs import FacetingConfig
+from dr_plotter.faceting.facet_index import FacetIndex
+from dr_plotter.faceting.layout_utils import get_grid_dimensions
+
+
+@dataclass
+class FacetPlan:
+    config: FacetingConfig
+    facet_index: FacetIndex
+    grid_shape: tuple[int, int]
+    row_values: list[Any]
+    col_values: list[Any]
+    wrap_values: list[Any]
+    subplot_titles: dict[tuple[int, int], str] = field(default_factory=dict)
+    row_titles: dict[int, str] = field(default_factory=dict)
+    x_labels: dict[tuple[int, int], str] = field(default_factory=dict)
+    y_labels: dict[tuple[int, int], str] = field(default_factory=dict)
+
+    @classmethod
+    def from_data(
+        cls,
+        data: pd.DataFrame,
+        config: FacetingConfig,
+        facet_index: FacetIndex | None = None,
+    ) -> FacetPlan:
+        if facet_index is None:
+            facet_index = FacetIndex(data, config)
+        plan = cls(
+            config=config,
+            facet_index=facet_index,
+            grid_shape=get_grid_dimensions(data, config, facet_index),
+            row_values=_dimension_values(facet_index, config.rows_by),
+            col_values=_dimension_values(facet_index, config.cols_by),
+            wrap_values=facet_index.values(config.wrap_by) if config.wrap_by else [],
+        )
+        plan._resolve_titles()
+        plan._resolve_exterior_labels()
+        return plan
+
+    @property
+    def cells(self) -> list[tuple[int, int]]:
+        rows, cols = self.grid_shape
+        return [(row, col) for row in range(rows) for col in range(cols)]
+
+    def _resolve_titles(self) -> None:
+        config = self.config
+        if config.wrap_by and config.auto_titles:
+            _, cols = self.grid_shape
+            for row, col in self.cells:
+                subplot_index = row * cols + col
+                if subplot_index < len(self.wrap_values):
+                    value = self.wrap_values[subplot_index]
+                    self.subplot_titles[(row, col)] = f"{config.wrap_by}={value}"
+            return
+
+        if config.row_titles:
+            for row in range(min(self.grid_shape[0], len(self.row_values))):
+                title = _resolve_dimension_title(
+                    config.row_titles, row, self.row_values
+                )
+                if title:
+                    self.row_titles[row] = title
+
+        if config.col_titles:
+            for col in range(min(self.grid_shape[1], len(self.col_values))):
+                title = _resolve_dimension_title(
+                    config.col_titles, col, self.col_values
+                )
+                if title:
+                    self.subplot_titles[(0, col)] = title
+
+    def _resolve_exterior_labels(self) -> None:
+        config = self.config
+        if not (config.exterior_x_label or config.exterior_y_label):
+            return
+
+        if config.wrap_by:
+            n_rows = self.grid_shape[0]
+            dimension_name = config.wrap_by
+        else:
+            n_rows = len(self.row_values)
+            dimension_name = config.rows_by or config.cols_by
+
+        for row, col in self.cells:
+            if config.exterior_x_label and row == n_rows - 1:
+                self.x_labels[(row, col)] = config.exterior_x_label
+            if col == 0:
+                if config.exterior_y_label:
+                    self.y_labels[(row, col)] = config.exterior_y_label
+                elif config.wrap_by and dimension_name:
+                    self.y_labels[(row, col)] = dimension_name.capitalize()
+
+
+def _dimension_values(facet_index: FacetIndex, dim: str | None) -> list[Any]:
+    return facet_index.values(dim) if dim else [None]
+
+
+def _resolve_dimension_title(
+    title_config: bool | list[str], index: int, dimension_values: list[Any]
+) -> str | None:
+    if title_config is True:
+        return str(dimension_values[index]) if index < len(dimension_values) else None
+    elif isinstance(title_config, list):
+        return title_config[index] if index < len(title_config) else None
+    return None
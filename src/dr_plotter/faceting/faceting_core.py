@@ -2,23 +2,32 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+import matplotlib as mpl
 import matplotlib.axes
+import numpy as np
 import pandas as pd
+from matplotlib.text import Text
+from matplotlib.transforms import ScaledTranslation
 
 from dr_plotter.configs import FacetingConfig
-from dr_plotter.faceting.dimensional_utils import resolve_dimension_values
+from dr_plotter.faceting.facet_index import FacetIndex
 from dr_plotter.styling_utils import apply_grid_styling
 
 if TYPE_CHECKING:
+    from dr_plotter.faceting.facet_plan import FacetPlan
     from dr_plotter.figure_manager import FigureManager
 
 GRID_SHAPE_DIMENSIONS = 2
 HORIZONTAL_TEXT_ANGLE = 0
 VERTICAL_TEXT_ANGLE = 90
+POINTS_PER_INCH = 72.0
 
 
 def prepare_faceted_subplots(
-    data: pd.DataFrame, config: FacetingConfig, grid_shape: tuple[int, int]
+    data: pd.DataFrame,
+    config: FacetingConfig,
+    grid_shape: tuple[int, int],
+    facet_index: FacetIndex | None = None,
 ) -> dict[tuple[int, int], pd.DataFrame]:
     assert not data.empty, "Cannot facet empty DataFrame"
     assert (
@@ -40,60 +49,65 @@ def prepare_faceted_subplots(
             f"Target position ({config.target_row}, {config.target_col}) "
             f"exceeds grid dimensions {grid_shape}"
         )
-        subsets = {(config.target_row, config.target_col): data.copy()}
-        return subsets
+        return {(config.target_row, config.target_col): data}
 
+    if facet_index is None:
+        facet_index = FacetIndex(data, config)
+    assert facet_index.n_rows == len(data), "FacetIndex was built for other data"
+    cell_indices = partition_facet_indices(facet_index, config, grid_shape)
+    return {cell: data.take(indices) for cell, indices in cell_indices.items()}
+
+
+def partition_facet_indices(
+    facet_index: FacetIndex, config: FacetingConfig, grid_shape: tuple[int, int]
+) -> dict[tuple[int, int], np.ndarray]:
+    rows, cols = grid_shape
     if config.wrap_by:
-        values = resolve_dimension_values(data, config.wrap_by, config)
-        rows, cols = grid_shape
-        subsets = {}
-        for i, val in enumerate(values):
-            r = i // cols
-            c = i % cols
-            if r < rows:
-                subset = data[data[config.wrap_by] == val].copy()
-                if not subset.empty:
-                    subsets[(r, c)] = subset
+        n_cells = min(len(facet_index.values(config.wrap_by)), rows * cols)
+        cell_codes = facet_index.codes(config.wrap_by)
+        cell_codes = np.where(cell_codes < n_cells, cell_codes, -1)
+        n_cell_cols = cols
     else:
-        row_values = (
-            [None]
-            if config.rows_by is None
-            else resolve_dimension_values(data, config.rows_by, config)
-        )
-        col_values = (
-            [None]
-            if config.cols_by is None
-            else resolve_dimension_values(data, config.cols_by, config)
+        row_codes, _ = _optional_dimension_codes(facet_index, config.rows_by)
+        col_codes, n_col_values = _optional_dimension_codes(facet_index, config.cols_by)
+        cell_codes = np.where(
+            (row_codes >= 0) & (col_codes >= 0),
+            row_codes * n_col_values + col_codes,
+            -1,
         )
+        n_cell_cols = n_col_values
 
-        subsets = {}
-        for r, row_val in enumerate(row_values):
-            for c, col_val in enumerate(col_values):
-                subset = _create_data_subset(data, config, row_val, col_val)
-                if not subset.empty:
-                    subsets[(r, c)] = subset
-    return subsets
+    order = np.argsort(cell_codes, kind="stable")
+    sorted_codes = cell_codes[order]
+    boundaries = np.flatnonzero(np.diff(sorted_codes)) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [len(sorted_codes)]))
 
+    cell_indices = {}
+    for start, end in zip(starts, ends):
+        code = sorted_codes[start] if end > start else -1
+        if code < 0:
+            continue
+        cell = (int(code // n_cell_cols), int(code % n_cell_cols))
+        cell_indices[cell] = order[start:end]
+    return dict(sorted(cell_indices.items()))
 
-def _create_data_subset(
-    data: pd.DataFrame, config: FacetingConfig, row_val: Any, col_val: Any
-) -> pd.DataFrame:
-    mask = pd.Series([True] * len(data), index=data.index)
-    if row_val is not None and config.rows_by:
-        mask = mask & (data[config.rows_by] == row_val)
-    if col_val is not None and config.cols_by:
-        mask = mask & (data[config.cols_by] == col_val)
-    return data[mask].copy()
+
+def _optional_dimension_codes(
+    facet_index: FacetIndex, dim: str | None
+) -> tuple[np.ndarray, int]:
+    if dim is None:
+        return np.zeros(facet_index.n_rows, dtype=np.intp), 1
+    return facet_index.codes(dim), len(facet_index.values(dim))
 
 
 # TODO: why is this unused??
 def _apply_subplot_customization(
-    fm: FigureManager, row: int, col: int, config: FacetingConfig, data: pd.DataFrame
+    fm: FigureManager, row: int, col: int, plan: FacetPlan
 ) -> None:
-    _apply_axis_labels(fm, row, col, config)
-    _apply_exterior_labels(fm, row, col, config, data)
-    _apply_axis_limits(fm, row, col, config)
-    _apply_dimension_titles(fm, row, col, config, data)
+    _apply_axis_labels(fm, row, col, plan.config)
+    _apply_exterior_labels(fm, row, col, plan)
+    _apply_dimension_titles(fm, row, col, plan)
     _apply_grid_styling(fm, row, col)
 
 
@@ -113,126 +127,51 @@ def _apply_axis_labels(
             ax.set_ylabel(label)
 
 
-def _apply_axis_limits(
-    fm: FigureManager, row: int, col: int, config: FacetingConfig
-) -> None:
-    ax = fm.get_axes(row, col)
-
-    if _has_custom_label(fm.layout_config.xlim, row, col):
-        xlim = fm.layout_config.xlim[row][col]
-        if xlim is not None:
-            ax.set_xlim(xlim)
-
-    if _has_custom_label(fm.layout_config.ylim, row, col):
-        ylim = fm.layout_config.ylim[row][col]
-        if ylim is not None:
-            ax.set_ylim(ylim)
-
-
 def _has_custom_label(labels: list[list[Any]] | None, row: int, col: int) -> bool:
     return labels is not None and row < len(labels) and col < len(labels[row])
 
 
 def _apply_exterior_labels(
-    fm: FigureManager, row: int, col: int, config: FacetingConfig, data: pd.DataFrame
+    fm: FigureManager, row: int, col: int, plan: FacetPlan
 ) -> None:
-    if not (config.exterior_x_label or config.exterior_y_label):
-        return
-
     ax = fm.get_axes(row, col)
 
-    if config.wrap_by:
-        n_rows, n_cols = fm.layout_config.rows, fm.layout_config.cols
-        dimension_name = config.wrap_by
-    else:
-        row_values = (
-            resolve_dimension_values(data, config.rows_by, config)
-            if config.rows_by
-            else [None]
-        )
-        col_values = (
-            resolve_dimension_values(data, config.cols_by, config)
-            if config.cols_by
-            else [None]
-        )
-        n_rows = len(row_values) if config.rows_by else 1
-        n_cols = len(col_values) if config.cols_by else 1  # noqa: F841
-        dimension_name = config.rows_by or config.cols_by
-
-    if config.exterior_x_label and row == n_rows - 1:
-        ax.set_xlabel(config.exterior_x_label)
+    x_label = plan.x_labels.get((row, col))
+    if x_label:
+        ax.set_xlabel(x_label)
 
-    if col == 0:
-        if config.exterior_y_label:
-            # Use explicitly provided label
-            ax.set_ylabel(config.exterior_y_label)
-        elif config.wrap_by and dimension_name:
-            # Auto-label with dimension name for rows_and_cols mode
-            ax.set_ylabel(dimension_name.capitalize())
+    y_label = plan.y_labels.get((row, col))
+    if y_label:
+        ax.set_ylabel(y_label)
 
 
 def _apply_dimension_titles(
-    fm: FigureManager, row: int, col: int, config: FacetingConfig, data: pd.DataFrame
+    fm: FigureManager, row: int, col: int, plan: FacetPlan
 ) -> None:
     ax = fm.get_axes(row, col)
+    config = plan.config
+
+    row_title = plan.row_titles.get(row) if col == 0 else None
+    if row_title:
+        rotation = config.row_title_rotation
+        if rotation is None:
+            rotation = fm.styler.get_style("row_title_rotation", VERTICAL_TEXT_ANGLE)
+
+        offset = config.row_title_offset
+        if offset is None:
+            offset = fm.styler.get_style("row_title_offset", -0.15)
+
+        fontsize = fm.styler.get_style("title_fontsize", 14)
+        previous = fm.row_titles.pop(row, None)
+        if previous is not None:
+            previous.remove()
+        fm.row_titles[row] = _add_row_title(
+            ax, row_title, offset=offset, rotation=rotation, fontsize=fontsize
+        )
 
-    if config.wrap_by and config.auto_titles:
-        values = resolve_dimension_values(data, config.wrap_by, config)
-        _, grid_cols = fm.layout_config.rows, fm.layout_config.cols
-
-        subplot_index = row * grid_cols + col
-        if subplot_index < len(values):
-            value = values[subplot_index]
-            title = f"{config.wrap_by}={value}"
-            ax.set_title(title, pad=10)
-        return
-
-    if not (config.row_titles or config.col_titles):
-        return
-
-    row_values = (
-        resolve_dimension_values(data, config.rows_by, config)
-        if config.rows_by
-        else [None]
-    )
-    col_values = (
-        resolve_dimension_values(data, config.cols_by, config)
-        if config.cols_by
-        else [None]
-    )
-
-    if config.row_titles and col == 0 and row < len(row_values):
-        title = _resolve_dimension_title(config.row_titles, row, row_values)
-        if title:
-            rotation = config.row_title_rotation
-            if rotation is None:
-                rotation = fm.styler.get_style(
-                    "row_title_rotation", VERTICAL_TEXT_ANGLE
-                )
-
-            offset = config.row_title_offset
-            if offset is None:
-                offset = fm.styler.get_style("row_title_offset", -0.15)
-
-            fontsize = fm.styler.get_style("title_fontsize", 14)
-            _add_row_title(
-                ax, title, offset=offset, rotation=rotation, fontsize=fontsize
-            )
-
-    if config.col_titles and row == 0 and col < len(col_values):
-        title = _resolve_dimension_title(config.col_titles, col, col_values)
-        if title:
-            ax.set_title(title, pad=10)
-
-
-def _resolve_dimension_title(
-    title_config: bool | list[str], index: int, dimension_values: list[Any]
-) -> str | None:
-    if title_config is True:
-        return str(dimension_values[index]) if index < len(dimension_values) else None
-    elif isinstance(title_config, list):
-        return title_config[index] if index < len(title_config) else None
-    return None
+    title = plan.subplot_titles.get((row, col))
+    if title:
+        ax.set_title(title, pad=10)
 
 
 def _add_row_title(
@@ -241,12 +180,12 @@ def _add_row_title(
     offset: float = -0.15,
     rotation: float = 0,
     fontsize: float = 14,
-) -> None:
-    ax_left = ax.twinx()
-    ax_left.yaxis.set_label_position("left")
-    ax_left.spines["left"].set_position(("axes", offset))
-    ax_left.spines["left"].set_visible(False)
-    ax_left.set_yticks([])
+) -> Text:
+    # A figure-level text anchored to the axes, placed where a left y label
+    # would sit with its spine moved out to `offset` (in axes fractions).
+    fig = ax.get_figure()
+    labelpad = mpl.rcParams["axes.labelpad"] / POINTS_PER_INCH
+    transform = ax.transAxes + ScaledTranslation(-labelpad, 0, fig.dpi_scale_trans)
     if rotation == VERTICAL_TEXT_ANGLE:
         va = "bottom"  # For vertical text, align to bottom
     elif rotation == HORIZONTAL_TEXT_ANGLE:
@@ -254,12 +193,18 @@ def _add_row_title(
     else:
         va = "center"  # Default for other angles
 
-    ax_left.set_ylabel(
+    return fig.text(
+        offset,
+        0.5,
         title,
+        transform=transform,
         rotation=rotation,
+        rotation_mode="anchor",
         size=fontsize,
         ha="right",
         va=va,
+        color=mpl.rcParams["axes.labelcolor"],
+        fontweight=mpl.rcParams["axes.labelweight"],
     )
 
 
@@ -5,7 +5,7 @@ import math
 import pandas as pd
 
 from dr_plotter.configs import FacetingConfig
-from dr_plotter.faceting.dimensional_utils import resolve_dimension_values
+from dr_plotter.faceting.facet_index import FacetIndex
 
 
 def calculate_auto_sizing(
@@ -31,23 +31,19 @@ def calculate_wrapped_grid(
     return n_rows, n_cols
 
 
-def get_grid_dimensions(data: pd.DataFrame, config: FacetingConfig) -> tuple[int, int]:
+def get_grid_dimensions(
+    data: pd.DataFrame,
+    config: FacetingConfig,
+    facet_index: FacetIndex | None = None,
+) -> tuple[int, int]:
     assert not data.empty, "Cannot compute dimensions from empty DataFrame"
     if config.target_row is not None and config.target_col is not None:
         return max(config.target_row + 1, 1), max(config.target_col + 1, 1)
+    if facet_index is None:
+        facet_index = FacetIndex(data, config)
     if config.wrap_by:
-        values = resolve_dimension_values(data, config.wrap_by, config)
+        values = facet_index.values(config.wrap_by)
         return calculate_wrapped_grid(values, config.max_cols, config.max_rows)
-    row_values = (
-        resolve_dimension_values(data, config.rows_by, config)
-        if config.rows_by
-        else [None]
-    )
-    col_values = (
-        resolve_dimension_values(data, config.cols_by, config)
-        if config.cols_by
-        else [None]
-    )
-    n_rows = len(row_values)
-    n_cols = len(col_values)
+    n_rows = len(facet_index.values(config.rows_by)) if config.rows_by else 1
+    n_cols = len(facet_index.values(config.cols_by)) if config.cols_by else 1
     return n_rows, n_cols
@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import functools
+import math
+from typing import Any
+
+import matplotlib as mpl
+from matplotlib import cbook
+from matplotlib.font_manager import FontProperties
+from matplotlib.transforms import Bbox
+from matplotlib.textpath import TextToPath
+
+POINTS_PER_INCH = 72.0
+LINE_SPACING = 1.2
+
+DEFAULT_TICK_LABELS = {"labelleft", "labelbottom"}
+
+Rect = tuple[float, float, float, float]
+Margins = tuple[float, float, float, float]
+FontKey = tuple[Any, ...]
+
+_TEXT_TO_PATH = TextToPath()
+
+
+def apply_fast_layout(
+    fig: Any,
+    grid: list[list[Any]],
+    rect: Rect | None,
+    pad: float,
+    row_titles: dict[int, Any] | None = None,
+) -> None:
+    # Positions the grid like tight_layout, but from tick formatter output and
+    # cached font metrics instead of a renderer pass over every artist.
+    rect_left, rect_bottom, rect_right, rect_top = rect or (0.0, 0.0, 1.0, 1.0)
+    fig_width, fig_height = fig.get_size_inches()
+    rows, cols = len(grid), len(grid[0])
+    pad_inches = pad * mpl.rcParams["font.size"] / POINTS_PER_INCH
+    cell_size = (
+        (rect_right - rect_left) * fig_width / cols,
+        (rect_top - rect_bottom) * fig_height / rows,
+    )
+
+    attached = _attached_axes(fig, grid)
+    margins = [
+        [
+            _measured_margins(ax, attached[id(ax)], fig)
+            if attached.get(id(ax))
+            else _axes_margins(ax, cell_size)
+            for ax in row
+        ]
+        for row in grid
+    ]
+
+    left_margin = _max(margins[r][0][0] for r in range(rows))
+    for row, title in (row_titles or {}).items():
+        left_margin = max(left_margin, _row_title_extent(title, grid[row][0], fig))
+    bottom_margin = _max(margins[rows - 1][c][1] for c in range(cols))
+    right_margin = _max(margins[r][cols - 1][2] for r in range(rows))
+    top_margin = _max(margins[0][c][3] for c in range(cols))
+    suptitle = fig._suptitle  # noqa: SLF001
+    if suptitle is not None and suptitle.get_in_layout() and suptitle.get_text():
+        top_margin += _text_extent(suptitle, horizontal=False) + pad_inches
+    left = rect_left + (left_margin + pad_inches) / fig_width
+    bottom = rect_bottom + (bottom_margin + pad_inches) / fig_height
+    right = rect_right - (right_margin + pad_inches) / fig_width
+    top = rect_top - (top_margin + pad_inches) / fig_height
+
+    wspace = _max(
+        margins[r][c][2] + margins[r][c + 1][0]
+        for r in range(rows)
+        for c in range(cols - 1)
+    )
+    hspace = _max(
+        margins[r][c][1] + margins[r + 1][c][3]
+        for r in range(rows - 1)
+        for c in range(cols)
+    )
+    wspace += pad_inches
+    hspace += pad_inches
+
+    axes_width = ((right - left) * fig_width - (cols - 1) * wspace) / cols
+    axes_height = ((top - bottom) * fig_height - (rows - 1) * hspace) / rows
+    assert axes_width > 0 and axes_height > 0, (
+        "Figure is too small for its axes decorations"
+    )
+    fig.subplots_adjust(
+        left=left,
+        right=right,
+        bottom=bottom,
+        top=top,
+        wspace=wspace / axes_width,
+        hspace=hspace / axes_height,
+    )
+
+
+def _axes_margins(ax: Any, cell_size: tuple[float, float]) -> Margins:
+    if ax is None or not ax.get_visible() or not ax.axison:
+        return (0.0, 0.0, 0.0, 0.0)
+    cell_width, cell_height = cell_size
+
+    left, y_low, y_high = _tick_label_extent(ax.yaxis, "labelleft", cell_height)
+    right, _, _ = _tick_label_extent(ax.yaxis, "labelright", cell_height)
+    bottom, x_low, x_high = _tick_label_extent(ax.xaxis, "labelbottom", cell_width)
+    top, _, _ = _tick_label_extent(ax.xaxis, "labeltop", cell_width)
+
+    if ax.get_ylabel():
+        left += _axis_label_extent(ax.yaxis, horizontal=True)
+    if ax.get_xlabel():
+        bottom += _axis_label_extent(ax.xaxis, horizontal=False)
+    if ax.get_title():
+        top += _text_extent(ax.title, horizontal=False)
+        top += mpl.rcParams["axes.titlepad"] / POINTS_PER_INCH
+
+    # Tick labels centred on ticks near an edge spill past the axes frame.
+    return (
+        max(left, x_low),
+        max(bottom, y_low),
+        max(right, x_high),
+        max(top, y_high),
+    )
+
+
+def _attached_axes(fig: Any, grid: list[list[Any]]) -> dict[int, list[Any]]:
+    # Colorbars appended with make_axes_locatable share their parent's
+    # subplotspec through the divider, so tight_layout lays them out together.
+    cells = {
+        _layout_subplotspec(ax): ax for row in grid for ax in row if ax is not None
+    }
+    grid_ids = {id(ax) for ax in cells.values()}
+    attached: dict[int, list[Any]] = {}
+    for ax in fig.axes:
+        if id(ax) in grid_ids or not ax.get_visible() or not ax.get_in_layout():
+            continue
+        parent = cells.get(_layout_subplotspec(ax))
+        if parent is not None:
+            attached.setdefault(id(parent), []).append(ax)
+    return attached
+
+
+def _layout_subplotspec(ax: Any) -> Any:
+    locator = ax.get_axes_locator()
+    if hasattr(locator, "get_subplotspec"):
+        return locator.get_subplotspec()
+    return ax.get_subplotspec()
+
+
+def _measured_margins(ax: Any, attached: list[Any], fig: Any) -> Margins:
+    # Divider-located axes shrink the parent within its cell, so the cell's
+    # margins come from a renderer pass over the whole group instead.
+    fig_width, fig_height = fig.get_size_inches()
+    cell = _layout_subplotspec(ax).get_position(fig)
+    group = [ax, *attached] if ax.get_visible() else attached
+    extent = Bbox.union([other.get_tightbbox(for_layout_only=True) for other in group])
+    return (
+        max(0.0, cell.x0 * fig_width - extent.x0 / fig.dpi),
+        max(0.0, cell.y0 * fig_height - extent.y0 / fig.dpi),
+        max(0.0, extent.x1 / fig.dpi - cell.x1 * fig_width),
+        max(0.0, extent.y1 / fig.dpi - cell.y1 * fig_height),
+    )
+
+
+def _row_title_extent(title: Any, ax: Any, fig: Any) -> float:
+    # Row titles sit at an axes-fraction offset left of the axes, measured
+    # against the current axes width just as tight_layout would.
+    if ax is None or not title.get_visible() or not title.get_text():
+        return 0.0
+    offset, _ = title.get_position()
+    axes_width = ax.get_position().width * fig.get_size_inches()[0]
+    extent = _text_extent(title, horizontal=True)
+    extent += mpl.rcParams["axes.labelpad"] / POINTS_PER_INCH
+    return extent + max(0.0, -offset) * axes_width
+
+
+def _tick_label_extent(
+    axis: Any, label_key: str, axis_length: float
+) -> tuple[float, float, float]:
+    # Returns the depth of the tick labels away from the axes and how far the
+    # first and last labels overhang the low and high ends of the axis.
+    if not axis.get_tick_params().get(label_key, label_key in DEFAULT_TICK_LABELS):
+        return 0.0, 0.0, 0.0
+    tick = axis.majorTicks[0]
+    label = tick.label1 if label_key in DEFAULT_TICK_LABELS else tick.label2
+    if not label.get_visible():
+        return 0.0, 0.0, 0.0
+
+    low, high = sorted(axis.get_view_interval())
+    locs = [loc for loc in axis.get_majorticklocs() if low <= loc <= high]
+    texts = axis.get_major_formatter().format_ticks(locs)
+    if not texts:
+        return 0.0, 0.0, 0.0
+
+    is_y = axis.axis_name == "y"
+    prop = label.get_fontproperties()
+    rotation = label.get_rotation()
+    depths, spans = [], []
+    for text in texts:
+        width, height = _measure(text, prop)
+        depths.append(_rotated_extent(width, height, rotation, horizontal=is_y))
+        spans.append(_rotated_extent(width, height, rotation, horizontal=not is_y))
+
+    scaled_low, scaled_high = axis.get_transform().transform([low, high])
+    first, last = axis.get_transform().transform([locs[0], locs[-1]])
+    scale = axis_length / (scaled_high - scaled_low or 1.0)
+    low_overhang = max(0.0, spans[0] / 2 - (first - scaled_low) * scale)
+    high_overhang = max(0.0, spans[-1] / 2 - (scaled_high - last) * scale)
+
+    depth = max(depths) + (tick.get_tick_padding() + tick.get_pad()) / POINTS_PER_INCH
+    return depth, low_overhang, high_overhang
+
+
+def _axis_label_extent(axis: Any, horizontal: bool) -> float:
+    return _text_extent(axis.label, horizontal) + axis.labelpad / POINTS_PER_INCH
+
+
+def _text_extent(text: Any, horizontal: bool) -> float:
+    lines = text.get_text().split("\n")
+    sizes = [_measure(line, text.get_fontproperties()) for line in lines]
+    width = max(line_width for line_width, _ in sizes)
+    height = max(line_height for _, line_height in sizes)
+    height *= 1 + LINE_SPACING * (len(lines) - 1)
+    return _rotated_extent(width, height, text.get_rotation(), horizontal)
+
+
+def _rotated_extent(
+    width: float, height: float, rotation: float, horizontal: bool
+) -> float:
+    angle = math.radians(rotation)
+    cos, sin = abs(math.cos(angle)), abs(math.sin(angle))
+    if horizontal:
+        return width * cos + height * sin
+    return width * sin + height * cos
+
+
+def _measure(text: str, prop: FontProperties) -> tuple[float, float]:
+    if not text:
+        return 0.0, 0.0
+    font_key = (
+        tuple(prop.get_family()),
+        prop.get_style(),
+        prop.get_variant(),
+        prop.get_weight(),
+        prop.get_stretch(),
+        prop.get_size_in_points(),
+        prop.get_math_fontfamily(),
+    )
+    return _measure_cached(text, font_key, mpl.rcParams["text.usetex"])
+
+
+@functools.lru_cache(maxsize=4096)
+def _measure_cached(text: str, font_key: FontKey, usetex: bool) -> tuple[float, float]:
+    family, style, variant, weight, stretch, size, math_fontfamily = font_key
+    prop = FontProperties(
+        family=list(family),
+        style=style,
+        variant=variant,
+        weight=weight,
+        stretch=stretch,
+        size=size,
+        math_fontfamily=math_fontfamily,
+    )
+    ismath = "TeX" if usetex else cbook.is_math_text(text)
+    width, height, _ = _TEXT_TO_PATH.get_text_width_height_descent(
+        text, prop, ismath=ismath
+    )
+    # Matplotlib lays out every line at least as tall as "lp".
+    _, line_height, _ = _TEXT_TO_PATH.get_text_width_height_descent(
+        "lp", prop, ismath=False
+    )
+    return width / POINTS_PER_INCH, max(height, line_height) / POINTS_PER_INCH
+
+
+def _max(values: Any) -> float:
+    return max(values, default=0.0)
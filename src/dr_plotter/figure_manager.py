@@ -1,45 +1,102 @@
 from __future__ import annotations
 
-from dataclasses import fields
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field, fields, replace
+from pathlib import Path
 from typing import Any
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+from matplotlib.text import Text
+from pandas.api.types import is_numeric_dtype
 
+from dr_plotter.cell_layout import apply_cell_layout
+from dr_plotter.channel_metadata import ChannelRegistry
 from dr_plotter.configs import (
     CycleConfig,
     FacetingConfig,
-    GroupingConfig,
     PlotConfig,
 )
 from dr_plotter.configs.legend_config import LegendStrategy
+from dr_plotter.consts import VISUAL_CHANNELS
+from dr_plotter.faceting.axis_sharing import (
+    Extent,
+    SharedTickLocator,
+    apply_extent,
+    data_extent,
+    merge_extents,
+    shared_extents,
+)
 from dr_plotter.faceting.dimensional_utils import (
     apply_dimensional_filters,
     generate_dimensional_title,
-    resolve_dimension_values,
 )
+from dr_plotter.faceting.facet_index import FacetIndex
+from dr_plotter.faceting.facet_plan import FacetPlan
 from dr_plotter.faceting.faceting_core import (
     _apply_subplot_customization,
     prepare_faceted_subplots,
 )
-from dr_plotter.faceting.layout_utils import get_grid_dimensions
 from dr_plotter.faceting.style_coordination import FacetStyleCoordinator
+from dr_plotter.fast_layout import apply_fast_layout
+from dr_plotter.figure_saver import DEFAULT_SAVE_DPI, FigureSaver
 from dr_plotter.legend_manager import (
     LegendEntry,
     LegendManager,
 )
-from dr_plotter.plotters.base import BasePlotter
+from dr_plotter.plotters.base import BasePlotter, PlotPipeline
 from dr_plotter.style_applicator import StyleApplicator
+from dr_plotter.style_engine import (
+    ContinuousRange,
+    continuous_range,
+    continuous_range_key,
+    merge_continuous_ranges,
+)
+from dr_plotter.tiled_rendering import (
+    DEFAULT_TILE_DPI,
+    MIN_TILE_WORKERS,
+    TileMosaic,
+    render_tiles,
+    tile_workers,
+)
 from dr_plotter.utils import get_axes_from_grid, parse_scale_pair
 
 FACETING_PARAM_NAMES = {f.name for f in fields(FacetingConfig)}
 DEFAULT_MARGIN = 0.05
+SUBPLOT_PARAM_NAMES = ("left", "bottom", "right", "top", "wspace", "hspace")
+
+
+@dataclass
+class BatchItemTiming:
+    value: Any
+    path: Path
+    plot_seconds: float
+    save_seconds: float
+
+    @property
+    def total_seconds(self) -> float:
+        return self.plot_seconds + self.save_seconds
+
+
+@dataclass
+class PanelLayer:
+    pipeline: PlotPipeline
+    plan: FacetPlan
+    data: pd.DataFrame | None = None
+    plotter: BasePlotter | None = None
+    appended: list[pd.DataFrame] = field(default_factory=list)
+    extents: dict[str, Extent | None] = field(default_factory=dict)
 
 
 class FigureManager:
-    def __init__(self, config: PlotConfig | None = None) -> None:
+    def __init__(
+        self, config: PlotConfig | None = None, updatable: bool = False
+    ) -> None:
         config = PlotConfig() if config is None else config
         self.config = config
+        self.updatable = updatable
 
         self.layout_config = config.layout
         self.style_config = config.style
@@ -50,6 +107,7 @@ class FigureManager:
         self.shared_cycle_config = (
             CycleConfig(self.theme) if self.shared_styling else None
         )
+        self.shared_continuous_ranges: dict[str, ContinuousRange] = {}
 
         self.styler = StyleApplicator(
             self.theme,
@@ -61,16 +119,38 @@ class FigureManager:
         self._facet_grid_info: dict[str, Any] | None = None
         self._facet_style_coordinator: FacetStyleCoordinator | None = None
         self._external_mode = False
-
-        self.fig, self.axes = plt.subplots(
-            self.layout_config.rows,
-            self.layout_config.cols,
-            constrained_layout=self.layout_config.constrained_layout,
-            **{
-                **self.layout_config.combined_kwargs,
-                "figsize": self.layout_config.figsize,
-            },
-        )
+        self._tiled = False
+
+        # What each plot() call drew per cell. Panel data (and streamed chunks)
+        # is only kept when updatable, so update() can redraw one panel.
+        self._panel_layers: dict[tuple[int, int], list[PanelLayer]] = {}
+        self._panel_aux_axes: dict[tuple[int, int], list[plt.Axes]] = {}
+        self.row_titles: dict[int, Text] = {}
+
+        # Allocated on first access so plot() can size the grid before creating it.
+        self._fig: plt.Figure | None = None
+        self._initial_subplotpars: dict[str, float] = {}
+        self._axes: Any = None
+
+    @property
+    def fig(self) -> plt.Figure:
+        if self._fig is None:
+            self._fig, self._axes, _ = self._create_figure_axes()
+        return self._fig
+
+    @fig.setter
+    def fig(self, fig: plt.Figure) -> None:
+        self._fig = fig
+
+    @property
+    def axes(self) -> Any:
+        if self._fig is None and self._axes is None:
+            self._fig, self._axes, _ = self._create_figure_axes()
+        return self._axes
+
+    @axes.setter
+    def axes(self, axes: Any) -> None:
+        self._axes = axes
 
     def _create_figure_axes(self) -> tuple[plt.Figure, plt.Axes, bool]:
         fig, axes = plt.subplots(
@@ -82,6 +162,11 @@ class FigureManager:
                 "figsize": self.layout_config.figsize,
             },
         )
+        # render_batch restores these so each frame is laid out from the same
+        # starting positions as a fresh figure.
+        self._initial_subplotpars = {
+            name: getattr(fig.subplotpars, name) for name in SUBPLOT_PARAM_NAMES
+        }
         return fig, axes, False
 
     def __enter__(self) -> FigureManager:
@@ -94,13 +179,49 @@ class FigureManager:
         self.legend_manager.finalize()
         self._apply_axis_labels()
         self._apply_axis_scaling()
+        self._apply_shared_limits()
         self._apply_figure_title()
-        if self.layout_config.tight_layout:
-            rect = self._get_tight_layout_rect()
+        if not self._tiled:
+            self._apply_layout_engine()
+
+    def _apply_layout_engine(self) -> None:
+        layout = self.layout_config
+        if layout.fast_layout:
+            grid = [
+                [self.get_axes(row, col) for col in range(layout.cols)]
+                for row in range(layout.rows)
+            ]
+            apply_fast_layout(
+                self.fig,
+                grid,
+                self._get_tight_layout_rect(),
+                layout.tight_layout_pad,
+                row_titles=self.row_titles,
+            )
+        elif layout.tight_layout:
             self.fig.tight_layout(
-                rect=rect,
-                pad=self.layout_config.tight_layout_pad,
+                rect=self._row_title_layout_rect(),
+                pad=layout.tight_layout_pad,
+            )
+
+    def _row_title_layout_rect(self) -> tuple[float, float, float, float] | None:
+        # tight_layout only measures axes, so whatever the row titles reach
+        # past the first column's own decorations is reserved through the rect.
+        rect = self._get_tight_layout_rect()
+        if not self.row_titles:
+            return rect
+        title_overhang = axes_overhang = 0.0
+        for row, title in self.row_titles.items():
+            ax = self.get_axes(row, 0)
+            frame_x0 = ax.get_window_extent().x0
+            title_overhang = max(
+                title_overhang, frame_x0 - title.get_window_extent().x0
             )
+            tight_x0 = ax.get_tightbbox(for_layout_only=True).x0
+            axes_overhang = max(axes_overhang, frame_x0 - tight_x0)
+        extra = max(0.0, title_overhang - axes_overhang) / self.fig.bbox.width
+        left, bottom, right, top = rect or (0.0, 0.0, 1.0, 1.0)
+        return (left + extra, bottom, right, top)
 
     def _get_tight_layout_rect(self) -> tuple[float, float, float, float] | None:
         if self.layout_config.tight_layout_rect is not None:
@@ -122,7 +243,7 @@ class FigureManager:
             return None
 
     def _apply_axis_labels(self) -> None:
-        if self._external_mode:
+        if self._external_mode or self._tiled:
             return
 
         if self.layout_config.x_labels is not None:
@@ -144,7 +265,7 @@ class FigureManager:
                         ax.set_ylabel("")
 
     def _apply_axis_scaling(self) -> None:
-        if self._external_mode:
+        if self._external_mode or self._tiled:
             return
 
         if self.layout_config.xyscale is not None:
@@ -200,20 +321,30 @@ class FigureManager:
 
     def _add_plot(
         self,
-        plotter_class: type,
-        plotter_args: tuple,
+        pipeline: PlotPipeline,
+        data: pd.DataFrame,
         row: int,
         col: int,
-        **kwargs: Any,
-    ) -> None:
+    ) -> BasePlotter:
         ax = self.axes if self._external_mode else self.get_axes(row, col)
-
-        kwargs["grouping_cfg"] = GroupingConfig.from_input(kwargs)
-
-        plotter = plotter_class(*plotter_args, figure_manager=self, **kwargs)
-        plotter.render(ax)
-
+        plotter = pipeline.render(data, ax)
         self._apply_layout_axis_settings(ax)
+        return plotter
+
+    def draw_cell(
+        self,
+        pipeline: PlotPipeline,
+        data: pd.DataFrame,
+        row: int,
+        col: int,
+        plan: FacetPlan,
+    ) -> BasePlotter:
+        # Draws cell (row, col) of a larger facet grid onto this manager's
+        # single axes, e.g. one tile of a tiled rendering.
+        self._external_mode = True
+        plotter = self._add_plot(pipeline, data, row, col)
+        _apply_subplot_customization(self, row, col, plan)
+        return plotter
 
     def _apply_layout_axis_settings(self, ax: Any) -> None:
         layout = self.layout_config
@@ -233,8 +364,35 @@ class FigureManager:
             )
             ax.margins(x=current_xmargin, y=current_ymargin)
 
+    def _apply_shared_limits(self) -> None:
+        # One pass over the plotted data replaces per-axes autoscaling with
+        # limits and ticks shared across the configured scope.
+        fixed_limits = {"x": self.layout_config.xlim, "y": self.layout_config.ylim}
+        for axis_name, fixed in fixed_limits.items():
+            scope = self._share_scope(axis_name)
+            if scope is None or fixed is not None:
+                continue
+            extents = {
+                cell: _cell_extent(layers, axis_name)
+                for cell, layers in self._panel_layers.items()
+            }
+            for (row, col), extent in shared_extents(extents, scope).items():
+                ax = self.get_axes(row, col)
+                apply_extent(getattr(ax, f"{axis_name}axis"), extent)
+
+    def _share_scope(self, axis_name: str) -> str | None:
+        scopes = {
+            getattr(layer.plan.config, f"share_{axis_name}")
+            for layers in self._panel_layers.values()
+            for layer in layers
+        } - {None}
+        assert len(scopes) <= 1, (
+            f"Conflicting share_{axis_name} scopes across plots: {sorted(scopes)}"
+        )
+        return next(iter(scopes), None)
+
+    @staticmethod
     def _resolve_faceting_config(
-        self,
         faceting: FacetingConfig | None,
         **kwargs: Any,
     ) -> FacetingConfig:
@@ -245,13 +403,181 @@ class FigureManager:
         config_dict.update({k: v for k, v in faceting_params.items() if v is not None})
         return FacetingConfig(**config_dict)
 
-    def plot(  # noqa: C901
+    def plot(
+        self,
+        data: pd.DataFrame,
+        plot_type: str,
+        faceting: FacetingConfig | None = None,
+        **kwargs: Any,
+    ) -> None:
+        plan, data_subsets, subplot_kwargs = self._prepare_facets(
+            data, faceting, **kwargs
+        )
+        pipeline = PlotPipeline(
+            BasePlotter.get_plotter(plot_type), figure_manager=self, **subplot_kwargs
+        )
+        for (row, col), subplot_data in data_subsets.items():
+            layer = PanelLayer(pipeline, plan)
+            self._panel_layers.setdefault((row, col), []).append(layer)
+            self._draw_panel_layer(layer, row, col, subplot_data)
+
+    def update(
+        self,
+        row: int,
+        col: int,
+        data: pd.DataFrame | None = None,
+        layer: int = -1,
+        **kwargs: Any,
+    ) -> None:
+        assert not self._tiled, "Tiled renderings cannot be updated per panel"
+        assert self.updatable, "update() requires FigureManager(updatable=True)"
+        layers = self._panel_layers.get((row, col))
+        assert layers, f"No plot has been drawn at ({row}, {col})"
+
+        target = layers[layer]
+        if data is not None:
+            target.data = data
+            target.appended.clear()
+        if kwargs:
+            pipeline = target.pipeline
+            target.pipeline = PlotPipeline(
+                pipeline.plotter_class,
+                figure_manager=self,
+                theme=kwargs.pop("theme", pipeline.theme),
+                **{**pipeline.kwargs, **kwargs},
+            )
+        self._redraw_panel(row, col)
+
+    def append(self, row: int, col: int, data: pd.DataFrame, layer: int = -1) -> None:
+        assert not self._tiled, "Tiled renderings cannot be appended to"
+        layers = self._panel_layers.get((row, col))
+        assert layers, f"No plot has been drawn at ({row}, {col})"
+
+        target = layers[layer]
+        assert hasattr(target.plotter, "append"), (
+            f"{target.pipeline.plotter_class.plotter_name} plots do not support "
+            "streaming appends"
+        )
+        target.plotter.append(data)
+        if self.updatable:
+            target.appended.append(data)
+        for axis_name, extent in target.extents.items():
+            chunk_extent = _frame_extent(target.pipeline, data, axis_name)
+            target.extents[axis_name] = merge_extents([extent, chunk_extent])
+        self._apply_shared_limits()
+
+    def _draw_panel_layer(
+        self, layer: PanelLayer, row: int, col: int, data: pd.DataFrame
+    ) -> None:
+        existing_axes = set(self.fig.axes)
+        plotter = self._add_plot(layer.pipeline, data, row, col)
+        _apply_subplot_customization(self, row, col, layer.plan)
+        self._panel_aux_axes.setdefault((row, col), []).extend(
+            ax for ax in self.fig.axes if ax not in existing_axes
+        )
+        # Shared limits only need the extents; append() only needs streaming
+        # plotters.
+        layer.extents = {
+            axis_name: _frame_extent(layer.pipeline, data, axis_name)
+            for axis_name in ("x", "y")
+        }
+        layer.plotter = plotter if hasattr(plotter, "append") else None
+        if self.updatable:
+            layer.data = data
+
+    def _redraw_panel(self, row: int, col: int) -> None:
+        ax = self.get_axes(row, col)
+        margins_before = _decoration_margins(ax)
+
+        aux_axes = self._panel_aux_axes.pop((row, col), [])
+        for aux_ax in aux_axes:
+            aux_ax.remove()
+        _clear_axes_content(ax)
+        self.legend_manager.registry.remove_axis(ax, *aux_axes)
+
+        for layer in self._panel_layers[(row, col)]:
+            data = layer.data
+            if layer.appended:
+                data = pd.concat([data, *layer.appended], ignore_index=True)
+                layer.appended.clear()
+            self._draw_panel_layer(layer, row, col, data)
+        apply_cell_layout(ax, self.layout_config, row, col)
+        self._apply_shared_limits()
+        self.legend_manager.refresh([ax])
+
+        # Other panels are untouched, so the layout only needs to run again
+        # when this panel's labels or tick labels take up a different margin.
+        if _decoration_margins(ax) != margins_before:
+            self._apply_layout_engine()
+
+    def plot_tiled(
         self,
         data: pd.DataFrame,
         plot_type: str,
         faceting: FacetingConfig | None = None,
+        processes: int | None = None,
+        dpi: float = DEFAULT_TILE_DPI,
         **kwargs: Any,
     ) -> None:
+        assert not self._tiled, "FigureManager already holds a tiled rendering"
+        if tile_workers(processes) < MIN_TILE_WORKERS:
+            # A single worker only adds pool overhead to a serial render.
+            self.plot(data, plot_type, faceting, **kwargs)
+            return
+        plan, data_subsets, subplot_kwargs = self._prepare_facets(
+            data, faceting, **kwargs
+        )
+        pipeline = PlotPipeline(
+            BasePlotter.get_plotter(plot_type), figure_manager=self, **subplot_kwargs
+        )
+        extents = {
+            axis_name: {
+                cell: _frame_extent(pipeline, subplot_data, axis_name)
+                for cell, subplot_data in data_subsets.items()
+            }
+            for axis_name in ("x", "y")
+        }
+        rect = self._get_tight_layout_rect() or (0.0, 0.0, 1.0, 1.0)
+        image, legend_entries = render_tiles(
+            self,
+            plot_type,
+            plan,
+            data_subsets,
+            subplot_kwargs,
+            extents,
+            rect,
+            processes=processes,
+            dpi=dpi,
+        )
+        self._show_tiled_image(image, rect, dpi)
+        for entry in legend_entries:
+            self.register_legend_entry(replace(entry, axis=self.axes))
+
+    def _show_tiled_image(
+        self,
+        image: np.ndarray,
+        rect: tuple[float, float, float, float],
+        dpi: float,
+    ) -> None:
+        left, bottom, right, top = rect
+        height, width = image.shape[:2]
+        if self._fig is not None:
+            plt.close(self._fig)
+        self.fig = plt.figure(
+            figsize=(width / dpi / (right - left), height / dpi / (top - bottom)),
+            dpi=dpi,
+        )
+        self.axes = self.fig.add_axes((left, bottom, right - left, top - bottom))
+        self.axes.set_axis_off()
+        self.fig.add_artist(TileMosaic(image, rect, dpi))
+        self._tiled = True
+
+    def _prepare_facets(  # noqa: C901
+        self,
+        data: pd.DataFrame,
+        faceting: FacetingConfig | None = None,
+        **kwargs: Any,
+    ) -> tuple[FacetPlan, dict[tuple[int, int], pd.DataFrame], dict[str, Any]]:
         assert not data.empty, "Cannot create faceted plot with empty DataFrame"
 
         if (
@@ -262,35 +588,31 @@ class FigureManager:
             faceting = self.config.faceting
 
         config = self._resolve_faceting_config(faceting, **kwargs)
-        grid_shape = get_grid_dimensions(data, config)
-
         data = apply_dimensional_filters(data, config)
+        plan = FacetPlan.from_data(data, config)
+        grid_shape = plan.grid_shape
+
         subplot_width = config.subplot_width or self.styler.get_style("subplot_width")
         subplot_height = config.subplot_height or self.styler.get_style(
             "subplot_height"
         )
 
         if subplot_width is not None and subplot_height is not None:
-            self.layout_config.figsize = (
-                subplot_width * grid_shape[1],
-                subplot_height * grid_shape[0],
-            )
+            current_shape = (self.layout_config.rows, self.layout_config.cols)
+            if grid_shape != (current_shape[0] * current_shape[1], 1):
+                # A layout whose axes already stack into the grid keeps its size.
+                self.layout_config.figsize = (
+                    subplot_width * grid_shape[1],
+                    subplot_height * grid_shape[0],
+                )
             self.layout_config.rows, self.layout_config.cols = grid_shape
 
-            if grid_shape != (
-                len(self.axes.flat) if hasattr(self.axes, "flat") else 1,
-                1,
-            ):
-                plt.close(self.fig)
-                self.fig, self.axes = plt.subplots(
-                    self.layout_config.rows,
-                    self.layout_config.cols,
-                    constrained_layout=self.layout_config.constrained_layout,
-                    **{
-                        **self.layout_config.combined_kwargs,
-                        "figsize": self.layout_config.figsize,
-                    },
-                )
+            if self._fig is not None and grid_shape == current_shape:
+                # An existing figure with this grid is kept and only resized.
+                self._fig.set_size_inches(self.layout_config.figsize)
+            elif self._fig is not None:
+                plt.close(self._fig)
+                self._fig, self._axes, _ = self._create_figure_axes()
 
         self._validate_grid_dimensions(grid_shape)
         if config.auto_titles:
@@ -302,7 +624,15 @@ class FigureManager:
             config.target_row = 0
             config.target_col = 0
 
-        data_subsets = prepare_faceted_subplots(data, config, grid_shape)
+        data_subsets = prepare_faceted_subplots(
+            data, config, grid_shape, plan.facet_index
+        )
+        for key, range_info in _continuous_ranges(
+            data_subsets.values(), config
+        ).items():
+            self.shared_continuous_ranges[key] = merge_continuous_ranges(
+                [self.shared_continuous_ranges.get(key), range_info]
+            )
         style_coordinator = self._get_or_create_style_coordinator()
         visual_channels = [
             config.hue_by,
@@ -313,36 +643,194 @@ class FigureManager:
         ]
         for channel in visual_channels:
             if channel:
-                channel_values = resolve_dimension_values(data, channel, config)
+                channel_values = plan.facet_index.values(channel)
                 style_coordinator.register_dimension_values(channel, channel_values)
         filtered_kwargs = {
             k: v for k, v in kwargs.items() if not hasattr(FacetingConfig, k)
         }
-        full_data = pd.concat(data_subsets.values(), ignore_index=True)
-        for (row, col), subplot_data in data_subsets.items():
-            subplot_kwargs = filtered_kwargs.copy()
-            if config.x:
-                subplot_kwargs["x"] = config.x
-            if config.y:
-                subplot_kwargs["y"] = config.y
-            if config.hue_by:
-                subplot_kwargs["hue_by"] = config.hue_by
-            if config.alpha_by:
-                subplot_kwargs["alpha_by"] = config.alpha_by
-            if config.size_by:
-                subplot_kwargs["size_by"] = config.size_by
-            if config.marker_by:
-                subplot_kwargs["marker_by"] = config.marker_by
-            if config.style_by:
-                subplot_kwargs["style_by"] = config.style_by
-            if config.hue_by:
-                subplot_kwargs["style_coordinator"] = style_coordinator
-
-            # Call _add_plot directly - no need for _plot() middleman
-            plotter_class = BasePlotter.get_plotter(plot_type)
-            self._add_plot(plotter_class, (subplot_data,), row, col, **subplot_kwargs)
-
-            _apply_subplot_customization(self, row, col, config, full_data)
+        subplot_kwargs = filtered_kwargs.copy()
+        if config.x:
+            subplot_kwargs["x"] = config.x
+        if config.y:
+            subplot_kwargs["y"] = config.y
+        if config.hue_by:
+            subplot_kwargs["hue_by"] = config.hue_by
+        if config.alpha_by:
+            subplot_kwargs["alpha_by"] = config.alpha_by
+        if config.size_by:
+            subplot_kwargs["size_by"] = config.size_by
+        if config.marker_by:
+            subplot_kwargs["marker_by"] = config.marker_by
+        if config.style_by:
+            subplot_kwargs["style_by"] = config.style_by
+        if config.hue_by:
+            subplot_kwargs["style_coordinator"] = style_coordinator
+        return plan, data_subsets, subplot_kwargs
+
+    @classmethod
+    def iter_pages(
+        cls,
+        data: pd.DataFrame,
+        plot_type: str,
+        page_shape: tuple[int, int],
+        config: PlotConfig | None = None,
+        faceting: FacetingConfig | None = None,
+        **kwargs: Any,
+    ) -> Iterator[FigureManager]:
+        config = PlotConfig() if config is None else config
+        faceting = config.faceting if faceting is None else faceting
+        faceting_config = cls._resolve_faceting_config(faceting, **kwargs)
+        assert faceting_config.wrap_by, "Paginated plotting requires wrap_by"
+        page_rows, page_cols = page_shape
+        assert page_rows > 0 and page_cols > 0, "page_shape must be positive"
+        plot_kwargs = {k: v for k, v in kwargs.items() if k not in FACETING_PARAM_NAMES}
+
+        wrap_by = faceting_config.wrap_by
+        data = apply_dimensional_filters(data, faceting_config)
+        wrap_index = FacetIndex(data, faceting_config, [wrap_by])
+        wrap_values = wrap_index.values(wrap_by)
+        wrap_codes = wrap_index.codes(wrap_by)
+        page_size = page_rows * page_cols
+        continuous_ranges = _continuous_ranges([data], faceting_config)
+
+        shared_cycle_config: CycleConfig | None = None
+        style_coordinator: FacetStyleCoordinator | None = None
+        for start in range(0, len(wrap_values), page_size):
+            page_positions = np.flatnonzero(
+                (wrap_codes >= start) & (wrap_codes < start + page_size)
+            )
+            if len(page_positions) == 0:
+                continue
+            page_faceting = replace(
+                faceting_config,
+                order={
+                    **(faceting_config.order or {}),
+                    wrap_by: wrap_values[start : start + page_size],
+                },
+                max_cols=page_cols,
+                max_rows=None,
+            )
+            page_config = replace(config, layout=replace(config.layout))
+
+            fm = cls(page_config)
+            fm.shared_continuous_ranges = continuous_ranges
+            if shared_cycle_config is None:
+                shared_cycle_config = fm.shared_cycle_config
+                style_coordinator = fm._get_or_create_style_coordinator()
+            else:
+                fm.shared_cycle_config = shared_cycle_config
+                fm._facet_style_coordinator = style_coordinator
+
+            with fm:
+                fm.plot(
+                    data.take(page_positions),
+                    plot_type,
+                    faceting=page_faceting,
+                    **plot_kwargs,
+                )
+            try:
+                yield fm
+            finally:
+                plt.close(fm.fig)
+
+    @classmethod
+    def render_batch(
+        cls,
+        data: pd.DataFrame,
+        plot_type: str,
+        sweep_over: str,
+        output_dir: str | Path,
+        *,
+        config: PlotConfig | None = None,
+        faceting: FacetingConfig | None = None,
+        filename_template: str = "{sweep_over}_{value}",
+        file_format: str = "png",
+        dpi: float = DEFAULT_SAVE_DPI,
+        compress_level: int | None = None,
+        **kwargs: Any,
+    ) -> list[BatchItemTiming]:
+        config = PlotConfig() if config is None else config
+        faceting = config.faceting if faceting is None else faceting
+        faceting_config = cls._resolve_faceting_config(faceting, **kwargs)
+        plot_kwargs = {k: v for k, v in kwargs.items() if k not in FACETING_PARAM_NAMES}
+        assert sweep_over in data.columns, f"Sweep column '{sweep_over}' not in data"
+
+        output_path = Path(output_dir).expanduser()
+        output_path.mkdir(parents=True, exist_ok=True)
+        data = apply_dimensional_filters(data, faceting_config)
+        sweep_index = FacetIndex(data, faceting_config, [sweep_over])
+        sweep_codes = sweep_index.codes(sweep_over)
+
+        fm = cls(config)
+        timings = []
+        try:
+            with FigureSaver() as saver:
+                for index, value in enumerate(sweep_index.values(sweep_over)):
+                    start = time.perf_counter()
+                    if index > 0:
+                        fm._reset_for_redraw()
+                    fm.plot(
+                        data.take(np.flatnonzero(sweep_codes == index)),
+                        plot_type,
+                        faceting=faceting_config,
+                        **plot_kwargs,
+                    )
+                    fm.finalize_layout()
+                    plotted = time.perf_counter()
+
+                    filename = filename_template.format(
+                        index=index, sweep_over=sweep_over, value=value
+                    )
+                    path = output_path / f"{filename.replace('/', '_')}.{file_format}"
+                    saver.save(
+                        fm.fig,
+                        path,
+                        file_format,
+                        dpi=dpi,
+                        compress_level=compress_level,
+                    )
+                    saved = time.perf_counter()
+                    timings.append(
+                        BatchItemTiming(
+                            value=value,
+                            path=path,
+                            plot_seconds=plotted - start,
+                            save_seconds=saved - plotted,
+                        )
+                    )
+        finally:
+            plt.close(fm.fig)
+        return timings
+
+    def _reset_for_redraw(self) -> None:
+        # Clears what a plot() + finalize_layout() pass drew while keeping the
+        # figure, canvas and grid axes (and their tick machinery) alive.
+        grid_axes = (
+            list(self._axes.flat) if hasattr(self._axes, "flat") else [self._axes]
+        )
+        for ax in self.fig.axes:
+            if not any(ax is grid_ax for grid_ax in grid_axes):
+                ax.remove()
+        for legend in list(self.fig.legends):
+            legend.remove()
+        # fig.suptitle() reuses its Text, so that one is blanked, not removed.
+        suptitle = self.fig._suptitle  # noqa: SLF001
+        for text in list(self.fig.texts):
+            if text is not suptitle:
+                text.remove()
+        if suptitle is not None:
+            suptitle.set_text("")
+        for ax in grid_axes:
+            _clear_axes_content(ax)
+        engine = self.fig.get_layout_engine()
+        if engine is None or engine.adjust_compatible:
+            self.fig.subplots_adjust(**self._initial_subplotpars)
+        self.legend_manager.registry.clear()
+        self.legend_manager.finalized = False
+        self._panel_layers.clear()
+        self._panel_aux_axes.clear()
+        self.row_titles.clear()
+        self.shared_continuous_ranges.clear()
 
     def _validate_grid_dimensions(self, grid_shape: tuple[int, int]) -> None:
         computed_rows, computed_cols = grid_shape
@@ -368,3 +856,92 @@ class FigureManager:
                 }
             self._facet_style_coordinator = FacetStyleCoordinator(theme=theme_info)
         return self._facet_style_coordinator
+
+
+def _continuous_ranges(
+    frames: Iterable[pd.DataFrame], config: FacetingConfig
+) -> dict[str, ContinuousRange]:
+    frames = list(frames)
+    ranges = {}
+    for channel in VISUAL_CHANNELS:
+        column = getattr(config, f"{channel}_by", None)
+        if not column or not ChannelRegistry.is_continuous(channel):
+            continue
+        merged = merge_continuous_ranges(
+            continuous_range(frame[column])
+            for frame in frames
+            if column in frame.columns and is_numeric_dtype(frame[column])
+        )
+        if merged is not None:
+            ranges[continuous_range_key(channel, column)] = merged
+    return ranges
+
+
+def _cell_extent(layers: list[PanelLayer], axis_name: str) -> Extent | None:
+    extents = [layer.extents[axis_name] for layer in layers]
+    # A layer whose extent cannot be read from its data leaves the cell to
+    # matplotlib's own autoscaling.
+    if any(extent is None for extent in extents):
+        return None
+    return merge_extents(extents)
+
+
+def _frame_extent(
+    pipeline: PlotPipeline, data: pd.DataFrame, axis_name: str
+) -> Extent | None:
+    columns = pipeline.kwargs.get(axis_name)
+    if not pipeline.plotter_class.data_limits or not columns:
+        return None
+    return data_extent(data, [columns] if isinstance(columns, str) else columns)
+
+
+def _clear_axes_content(ax: Any) -> None:
+    if ax.xaxis.units is not None or ax.yaxis.units is not None:
+        # Categorical axes keep their category mapping; only a full clear resets it.
+        ax.cla()
+        return
+    for artist in [
+        *ax.lines,
+        *ax.collections,
+        *ax.patches,
+        *ax.texts,
+        *ax.images,
+        *ax.tables,
+    ]:
+        artist.remove()
+    ax.containers.clear()
+    legend = ax.get_legend()
+    if legend is not None:
+        legend.remove()
+    ax.set_title("")
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    # Plotters switch the grid on for the panels they draw into.
+    ax.grid(visible=False)
+    ax.set_axes_locator(None)
+    for axis in (ax.xaxis, ax.yaxis):
+        locator = axis.get_major_locator()
+        if isinstance(locator, SharedTickLocator):
+            axis.set_major_locator(locator.source)
+    ax.relim()
+    # Panels left empty by the next frame must show a fresh axes' limits.
+    for set_scale, set_lim in (
+        (ax.set_xscale, ax.set_xlim),
+        (ax.set_yscale, ax.set_ylim),
+    ):
+        set_scale("linear")
+        set_lim(0, 1, auto=True)
+
+
+def _decoration_margins(ax: Any) -> tuple[int, ...]:
+    tight = ax.get_tightbbox()
+    frame = ax.get_window_extent()
+    return tuple(
+        round(margin)
+        for margin in (
+            frame.x0 - tight.x0,
+            frame.y0 - tight.y0,
+            tight.x1 - frame.x1,
+            tight.y1 - frame.y1,
+        )
+    )
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import io
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import matplotlib as mpl
+import numpy as np
+from matplotlib.image import imsave
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import Self
+
+DEFAULT_SAVE_DPI = 300
+DEFAULT_SAVE_WORKERS = 2
+RASTER_FORMATS = {"png", "webp"}
+
+
+class FigureSaver:
+    # Rendering stays on the calling thread (matplotlib figures are not thread
+    # safe); only encoding and the disk write move to the pool, so the caller
+    # can close the figure or start drawing the next one straight away.
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_SAVE_WORKERS,
+        max_pending: int | None = None,
+    ) -> None:
+        assert max_workers > 0, f"max_workers must be positive, got {max_workers}"
+        max_pending = 2 * max_workers if max_pending is None else max_pending
+        assert max_pending > 0, f"max_pending must be positive, got {max_pending}"
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="dr_plotter_saver"
+        )
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending: list[Future[Path]] = []
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        try:
+            if exc_type is None:
+                self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def save(
+        self,
+        fig: Any,
+        path: str | Path,
+        file_format: str | None = None,
+        dpi: float = DEFAULT_SAVE_DPI,
+        compress_level: int | None = None,
+    ) -> Future[Path]:
+        path = Path(path)
+        file_format = (file_format or path.suffix.lstrip(".") or "png").lower()
+
+        if file_format in RASTER_FORMATS:
+            payload = _rasterize(fig, dpi)
+            write, args = _write_raster, (file_format, dpi, compress_level)
+        else:
+            # Vector backends serialize while walking the figure, so only the
+            # write itself can be deferred.
+            payload = _serialize(fig, file_format, dpi, compress_level)
+            write, args = _write_bytes, ()
+
+        # Bounds the number of rendered buffers held in memory at once.
+        self._slots.acquire()
+        future = self._executor.submit(write, payload, path, *args)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._pending = [f for f in self._pending if not f.done()]
+        self._pending.append(future)
+        return future
+
+    def flush(self) -> list[Path]:
+        pending, self._pending = self._pending, []
+        wait(pending)
+        return [future.result() for future in pending]
+
+
+def _rasterize(fig: Any, dpi: float) -> np.ndarray:
+    with io.BytesIO() as buffer:
+        fig.savefig(buffer, format="rgba", dpi=dpi)
+        pixels = np.frombuffer(buffer.getbuffer(), dtype=np.uint8).copy()
+    width, height = (int(size) for size in fig.get_size_inches() * dpi)
+    assert pixels.size == width * height * 4, (
+        "Cannot rasterize a figure saved with a cropped bounding box"
+    )
+    return pixels.reshape(height, width, 4)
+
+
+def _serialize(
+    fig: Any, file_format: str, dpi: float, compress_level: int | None
+) -> bytes:
+    rc = {}
+    if compress_level is not None and file_format == "pdf":
+        rc["pdf.compression"] = compress_level
+    with io.BytesIO() as buffer, mpl.rc_context(rc):
+        fig.savefig(buffer, format=file_format, dpi=dpi)
+        return buffer.getvalue()
+
+
+def _write_raster(
+    pixels: np.ndarray,
+    path: Path,
+    file_format: str,
+    dpi: float,
+    compress_level: int | None,
+) -> Path:
+    pil_kwargs = {}
+    if compress_level is not None:
+        # WebP's "method" is its speed/size trade-off, like zlib's level for PNG.
+        key = "compress_level" if file_format == "png" else "method"
+        pil_kwargs[key] = compress_level
+    imsave(
+        path,
+        pixels,
+        format=file_format,
+        origin="upper",
+        dpi=dpi,
+        pil_kwargs=pil_kwargs or None,
+    )
+    return path
+
+
+def _write_bytes(payload: bytes, path: Path) -> Path:
+    path.write_bytes(payload)
+    return path
@@ -23,9 +23,16 @@ class LegendRegistry:
     def __init__(self, strategy: LegendStrategy | None = None) -> None:
         self._entries: list[LegendEntry] = []
         self._seen_keys: set[tuple] = set()
+        # Every entry per axis, duplicates included, so a redrawn panel's
+        # entries replace its old ones and duplicates elsewhere come back.
+        self._added: dict[int, list[LegendEntry]] = {}
         self.legend_strategy = strategy
 
     def add_entry(self, entry: LegendEntry) -> None:
+        self._added.setdefault(id(entry.axis), []).append(entry)
+        self._index_entry(entry)
+
+    def _index_entry(self, entry: LegendEntry) -> None:
         if self._should_use_channel_based_deduplication():
             key = (entry.visual_channel, entry.channel_value)
         else:
@@ -50,9 +57,31 @@ class LegendRegistry:
     def get_by_channel(self, channel: str) -> list[LegendEntry]:
         return [e for e in self._entries if e.visual_channel == channel]
 
+    def remove_axis(self, *axes: Any) -> None:
+        removed = [self._added.pop(id(axis), None) for axis in axes]
+        if not any(removed):
+            return
+        self._entries.clear()
+        self._seen_keys.clear()
+        for entries in self._added.values():
+            for entry in entries:
+                self._index_entry(entry)
+
+    def retain_axes(self, axes: list[Any]) -> None:
+        # Keys hold id(axis), which a new axes can reuse once an old one is gone.
+        live = {id(axis) for axis in axes}
+        stale = [
+            entries[0].axis
+            for axis_id, entries in self._added.items()
+            if entries[0].axis is not None and axis_id not in live
+        ]
+        if stale:
+            self.remove_axis(*stale)
+
     def clear(self) -> None:
         self._entries.clear()
         self._seen_keys.clear()
+        self._added.clear()
 
 
 def resolve_legend_config(legend_input: str | LegendConfig) -> LegendConfig:
@@ -76,6 +105,7 @@ class LegendManager:
         self.fm = figure_manager
         self.config = config or LegendConfig()
         self.registry = LegendRegistry(self.config.legend_strategy)
+        self.finalized = False
 
     def _get_legend_position(self, legend_index: int = 0) -> tuple[float, float]:
         if self.config.legend_position is not None:
@@ -130,6 +160,7 @@ class LegendManager:
         return len(legend_entries) if len(legend_entries) > 0 else 1
 
     def finalize(self) -> None:
+        self.finalized = True
         if self.config.legend_strategy == LegendStrategy.NONE:
             return
 
@@ -140,6 +171,23 @@ class LegendManager:
         elif self.config.legend_strategy == LegendStrategy.PER_AXES:
             self._create_per_axes_legends()
 
+    def refresh(self, axes: list[Any]) -> None:
+        self.registry.retain_axes(self.fm.fig.axes)
+        # Legends are first built by finalize(); until then there is none to
+        # rebuild, and building one here would leave finalize() a duplicate.
+        if not self.finalized:
+            return
+        if self.config.legend_strategy == LegendStrategy.PER_AXES:
+            for ax in axes:
+                legend = ax.get_legend()
+                if legend is not None:
+                    legend.remove()
+            self._create_per_axes_legends(axes)
+            return
+        for legend in list(self.fm.fig.legends):
+            legend.remove()
+        self.finalize()
+
     def _process_entries_by_channel_type(
         self, entries: list[LegendEntry]
     ) -> list[LegendEntry]:
@@ -189,8 +237,10 @@ class LegendManager:
                 if legend:
                     legend.remove()
 
-    def _create_per_axes_legends(self) -> None:
+    def _create_per_axes_legends(self, only_axes: list[Any] | None = None) -> None:
         entries = self.registry.get_unique_entries()
+        if only_axes is not None:
+            entries = [e for e in entries if any(e.axis is ax for ax in only_axes)]
         result = self._prepare_legend_entries(entries)
         if result is None:
             return
@@ -1,5 +1,5 @@
 from .bar import BarPlotter
-from .base import BasePlotter
+from .base import BasePlotter, PlotPipeline
 from .bump import BumpPlotter
 from .contour import ContourPlotter
 from .heatmap import HeatmapPlotter
@@ -16,6 +16,7 @@ __all__ = [
     "HeatmapPlotter",
     "HistogramPlotter",
     "LinePlotter",
+    "PlotPipeline",
     "ScatterPlotter",
     "ViolinPlotter",
 ]
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import math
+from collections.abc import Sequence
 from typing import Any, ClassVar
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_numeric_dtype
 
 from dr_plotter import consts
 from dr_plotter.channel_metadata import ChannelRegistry
@@ -41,6 +45,116 @@ def ylabel_from_metrics(metrics: list[ColName]) -> str | None:
     return metrics[0]
 
 
+def stack_metrics(data: pd.DataFrame, metrics: list[ColName]) -> pd.DataFrame:
+    # The long format pd.melt would produce, built from codes and one value
+    # concatenation. Categories are sorted so groupby visits metrics in the
+    # same order as melt's string column.
+    n_rows = len(data)
+    metric_set = set(metrics)
+    id_cols = [c for c in data.columns if c not in metric_set]
+    stacked = data[id_cols].take(np.tile(np.arange(n_rows), len(metrics)))
+    stacked = stacked.reset_index(drop=True)
+
+    categories = sorted(metric_set)
+    codes = np.repeat([categories.index(metric) for metric in metrics], n_rows)
+    stacked[consts.METRIC_COL_NAME] = pd.Categorical.from_codes(codes, categories)
+    stacked[consts.Y_COL_NAME] = np.concatenate(
+        [data[metric].to_numpy() for metric in metrics]
+    )
+    return stacked
+
+
+def group_rows(
+    data: pd.DataFrame, columns: list[ColName], include_empty: bool = False
+) -> tuple[list[tuple[Any, ...]], list[np.ndarray]]:
+    # Group keys and row positions in groupby's sorted order, without building
+    # a frame per group. Rows with a missing key are dropped as groupby does;
+    # empty category combinations are only listed when asked for.
+    codes, levels = [], []
+    for column in columns:
+        series = data[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            column_codes = series.cat.codes.to_numpy()
+            column_levels = list(series.cat.categories)
+        else:
+            column_codes, uniques = pd.factorize(series, sort=True)
+            column_levels = list(uniques)
+        # Missing keys have code -1, so every code fits a signed type this small.
+        code_type = np.min_scalar_type(-len(column_levels) - 1)
+        codes.append(column_codes.astype(code_type, copy=False))
+        levels.append(column_levels)
+    shape = tuple(len(level) for level in levels)
+
+    # Folding the codes into one key of the smallest type that holds every
+    # combination keeps the sort below cheap (radix sort for up to 16 bits).
+    flat = np.zeros(len(data), dtype=np.min_scalar_type(-math.prod(shape) - 1))
+    valid = np.ones(len(data), dtype=bool)
+    for column_codes, size in zip(codes, shape):
+        flat *= size
+        flat += column_codes
+        valid &= column_codes >= 0
+
+    rows = None if valid.all() else np.flatnonzero(valid)
+    if rows is not None:
+        flat = flat[rows]
+    order = np.argsort(flat, kind="stable")
+    sorted_flat = flat[order]
+    starts = np.flatnonzero(np.diff(sorted_flat)) + 1
+    group_ids = sorted_flat[np.r_[0, starts]] if sorted_flat.size else sorted_flat
+    del flat, sorted_flat
+    if rows is not None:
+        order = rows[order]
+    positions = np.split(order, starts) if order.size else []
+
+    is_categorical = [
+        isinstance(data[column].dtype, pd.CategoricalDtype) for column in columns
+    ]
+    if include_empty and any(is_categorical):
+        # Like groupby(observed=False): every category is listed, crossed with
+        # the key combinations the other columns actually take.
+        by_id = dict(zip(group_ids.tolist(), positions))
+        group_ids = np.arange(math.prod(shape))
+        others = [j for j, categorical in enumerate(is_categorical) if not categorical]
+        if others:
+            other_shape = [shape[j] for j in others]
+            other_codes = [codes[j] for j in others]
+            present = np.logical_and.reduce([c >= 0 for c in other_codes])
+            candidate = np.unravel_index(group_ids, shape)
+            keep = np.isin(
+                np.ravel_multi_index([candidate[j] for j in others], other_shape),
+                np.ravel_multi_index([c[present] for c in other_codes], other_shape),
+            )
+            group_ids = group_ids[keep]
+        empty = np.array([], dtype=np.intp)
+        positions = [by_id.get(group_id, empty) for group_id in group_ids.tolist()]
+
+    names = [
+        tuple(level[code] for level, code in zip(levels, key))
+        for key in zip(*np.unravel_index(group_ids, shape))
+    ]
+    return names, positions
+
+
+class GroupedRows(Sequence):
+    # Each group's frame is only taken from the data when it is visited, so
+    # at most one group is materialized at a time.
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        names: list[tuple[Any, ...]],
+        positions: list[np.ndarray],
+    ) -> None:
+        self.data = data
+        self.names = names
+        self.positions = positions
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> GroupInfo:
+        return self.names[index], self.data.take(self.positions[index])
+
+
 class BasePlotter:
     _registry: ClassVar[dict[str, type]] = {}
 
@@ -62,6 +176,8 @@ class BasePlotter:
     default_theme: ClassVar[Theme] = BASE_THEME
     supports_legend: bool = True
     supports_grouped: ClassVar[bool] = True
+    # Draws x/y values as-is, so axis limits can be derived from the data alone.
+    data_limits: ClassVar[bool] = False
 
     component_schema: ClassVar[dict[Phase, ComponentSchema]] = {
         "plot": {"main": set()},
@@ -79,24 +195,33 @@ class BasePlotter:
         grouping_cfg: GroupingConfig,
         theme: Theme | None = None,
         figure_manager: Any | None = None,
+        pipeline: PlotPipeline | None = None,
         **kwargs: Any,
     ) -> None:
         self.raw_data: pd.DataFrame = data
         self.kwargs: dict[str, Any] = kwargs
         self.figure_manager: Any | None = figure_manager
-        grouping_cfg.validate_against_enabled(self.__class__.enabled_channels)
         self.grouping_params: GroupingConfig = grouping_cfg
-        self.theme = self.__class__.default_theme if theme is None else theme
-        self.style_engine: StyleEngine = StyleEngine(self.theme, self.figure_manager)
-        self.styler: StyleApplicator = StyleApplicator(
-            self.theme,
-            self.kwargs,
-            self.grouping_params,
-            figure_manager=self.figure_manager,
-            plot_type=self.__class__.plotter_name,
-            style_engine=self.style_engine,
-        )
+        if pipeline is None:
+            grouping_cfg.validate_against_enabled(self.__class__.enabled_channels)
+            self.theme = self.__class__.default_theme if theme is None else theme
+            self.style_engine: StyleEngine = StyleEngine(
+                self.theme, self.figure_manager
+            )
+            self.styler: StyleApplicator = StyleApplicator(
+                self.theme,
+                self.kwargs,
+                self.grouping_params,
+                figure_manager=self.figure_manager,
+                plot_type=self.__class__.plotter_name,
+                style_engine=self.style_engine,
+            )
+        else:
+            self.theme = pipeline.theme
+            self.style_engine = pipeline.style_engine
+            self.styler = pipeline.styler
         self.plot_data: pd.DataFrame | None = None
+        self._phase_styles: dict[str, dict[str, Any]] = {}
         self._initialize_subplot_specific_params()
 
         self.styler.register_post_processor(
@@ -148,19 +273,19 @@ class BasePlotter:
             if spec.channel_type == "continuous":
                 column = getattr(self.grouping_params, channel)
                 if column and column in self.plot_data.columns:
-                    values = self.plot_data[column].dropna().tolist()
-                    sample_values = values[:5]
-                    assert all(
-                        isinstance(v, (int, float))
-                        or (
-                            isinstance(v, str)
-                            and v.replace(".", "").replace("-", "").isdigit()
-                        )
-                        for v in sample_values
-                    ), f"Column {column} contains non-numeric values"
-
-                    if values:
-                        self.style_engine.set_continuous_range(channel, column, values)
+                    values = self.plot_data[column]
+                    if not is_numeric_dtype(values):
+                        sample_values = values.dropna().head(5).tolist()
+                        assert all(
+                            isinstance(v, (int, float))
+                            or (
+                                isinstance(v, str)
+                                and v.replace(".", "").replace("-", "").isdigit()
+                            )
+                            for v in sample_values
+                        ), f"Column {column} contains non-numeric values"
+
+                    self.style_engine.set_continuous_range(channel, column, values)
 
     def render(self, ax: Any) -> None:
         self.prepare_data()
@@ -187,49 +312,77 @@ class BasePlotter:
         self._apply_styling(ax)
 
     def prepare_data(self) -> None:
-        self.plot_data = self.raw_data.copy()
-
-        if self.x_col is not None:
-            self.plot_data = self.plot_data.rename(
-                columns={self.x_col: consts.X_COL_NAME}
-            )
+        # Projects to the columns this plotter reads under their plotting
+        # names. The projection wraps the source columns without copying them,
+        # so plotters only ever add columns to plot_data, never write into it.
+        available = set(self.raw_data.columns)
+        assert set(self.y_cols) <= available, "All metrics must be in the data"
+        renames = {self.x_col: consts.X_COL_NAME}
+        if len(self.y_cols) == 1:
+            renames[self.y_cols[0]] = consts.Y_COL_NAME
+        self.plot_data = pd.DataFrame(
+            {
+                renames.get(column, column): self.raw_data[column]
+                for column in self._required_columns()
+                if column in available
+            },
+            index=self.raw_data.index,
+            copy=False,
+        )
 
-        if len(self.y_cols) > 0:
-            df_cols = set(self.plot_data.columns)
-            value_cols = set(self.y_cols)
-            assert len(value_cols - df_cols) == 0, "All metrics must be in the data"
-            id_cols = df_cols - value_cols
-            self.plot_data = pd.melt(
-                self.plot_data,
-                id_vars=id_cols,
-                value_vars=self.y_cols,
-                var_name=consts.METRIC_COL_NAME,
-                value_name=consts.Y_COL_NAME,
-            )
+        if len(self.y_cols) == 1:
+            # A single metric needs no reshaping, only melt's output columns.
+            # reset_index would deep-copy every column without copy-on-write.
+            self.plot_data.index = pd.RangeIndex(len(self.plot_data))
+            self.plot_data[consts.METRIC_COL_NAME] = self.y_cols[0]
+        elif len(self.y_cols) > 1:
+            self.plot_data = stack_metrics(self.plot_data, self.y_cols)
 
         self._plot_specific_data_prep()
 
+    def _required_columns(self) -> list[ColName]:
+        columns = [self.x_col, *self.y_cols, *self.grouping_params.active.values()]
+        for param in self.__class__.plotter_params:
+            value = self.kwargs.get(param)
+            if isinstance(value, str):
+                columns.append(value)
+        return [c for c in dict.fromkeys(columns) if c is not None]
+
     def _resolve_phase_config(self, phase: str, **context: Any) -> dict[str, Any]:
-        phase_params = self.component_schema.get("plot", {}).get(phase, set())
+        if phase not in self._phase_styles:
+            self._phase_styles[phase] = self._resolve_static_phase_styles(phase)
         config = {}
 
+        for param, static_value in self._phase_styles[phase].items():
+            value = context.get(param)
+            if value is None:
+                value = static_value
+            if value is not None:
+                config[param] = value
+
+        config.update(self._resolve_computed_parameters(phase, context))
+        return config
+
+    def _resolve_static_phase_styles(self, phase: str) -> dict[str, Any]:
+        # Kwargs and theme are fixed for the lifetime of the plotter, so only the
+        # per-group context has to be consulted on every draw.
+        phase_params = self.component_schema.get("plot", {}).get(phase, set())
+        styles = {}
+
         for param in phase_params:
-            sources = [
-                lambda k: context.get(k),
-                lambda k: self.kwargs.get(f"{phase}_{k}"),
-                lambda k: self.kwargs.get(k),
-                lambda k: self.styler.get_style(f"{phase}_{k}"),
-                lambda k: self.styler.get_style(k),
-            ]
-
-            for source in sources:
-                value = source(param)
+            value = None
+            for key in (f"{phase}_{param}", param):
+                value = self.kwargs.get(key)
                 if value is not None:
-                    config[param] = value
                     break
+            if value is None:
+                for key in (f"{phase}_{param}", param):
+                    value = self.styler.get_style(key)
+                    if value is not None:
+                        break
+            styles[param] = value
 
-        config.update(self._resolve_computed_parameters(phase, context))
-        return config
+        return styles
 
     # TODO: Consider removing unused parameters if not needed by subclasses
     def _resolve_computed_parameters(self, phase: str, context: dict) -> dict[str, Any]:  # noqa: ARG002
@@ -263,7 +416,9 @@ class BasePlotter:
         self.styler.apply_post_processing(self.__class__.plotter_name, artists)
 
     def _render_with_grouped_method(self, ax: Any) -> None:
-        grouped_data = self._process_grouped_data()
+        self._render_groups(ax, self._process_grouped_data())
+
+    def _render_groups(self, ax: Any, grouped_data: Sequence[GroupInfo]) -> None:
         x_categories = self._extract_x_categories()
 
         for group_index, group_info in enumerate(grouped_data):
@@ -277,7 +432,7 @@ class BasePlotter:
 
             self._draw_grouped(ax, group_context["data"], group_position, **plot_kwargs)
 
-    def _process_grouped_data(self) -> list[GroupInfo]:
+    def _process_grouped_data(self) -> Sequence[GroupInfo]:
         categorical_cols = []
         for channel, column in self.grouping_params.active.items():
             spec = ChannelRegistry.get_spec(channel)
@@ -285,8 +440,11 @@ class BasePlotter:
                 categorical_cols.append(column)
 
         if categorical_cols:
-            grouped = self.plot_data.groupby(categorical_cols, observed=False)
-            return list(grouped)
+            include_empty = self.kwargs.get("show_empty_groups", False)
+            names, positions = group_rows(
+                self.plot_data, categorical_cols, include_empty=include_empty
+            )
+            return GroupedRows(self.plot_data, names, positions)
         else:
             return [(None, self.plot_data)]
 
@@ -389,3 +547,40 @@ class BasePlotter:
     # TODO: Determine if styles parameter should be used for grid customization
     def _style_grid(self, ax: Any, styles: dict[str, Any]) -> None:  # noqa: ARG002
         apply_grid_styling(ax, self.styler)
+
+
+class PlotPipeline:
+    def __init__(
+        self,
+        plotter_class: type[BasePlotter],
+        figure_manager: Any | None = None,
+        theme: Theme | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self.plotter_class = plotter_class
+        self.figure_manager = figure_manager
+        self.kwargs = kwargs
+        self.grouping_cfg = GroupingConfig.from_input(kwargs)
+        self.grouping_cfg.validate_against_enabled(plotter_class.enabled_channels)
+        self.theme = plotter_class.default_theme if theme is None else theme
+        self.style_engine = StyleEngine(self.theme, figure_manager)
+        self.styler = StyleApplicator(
+            self.theme,
+            self.kwargs,
+            self.grouping_cfg,
+            figure_manager=figure_manager,
+            plot_type=plotter_class.plotter_name,
+            style_engine=self.style_engine,
+        )
+
+    def render(self, data: pd.DataFrame, ax: Any) -> BasePlotter:
+        plotter = self.plotter_class(
+            data,
+            self.grouping_cfg,
+            self.theme,
+            self.figure_manager,
+            pipeline=self,
+            **self.kwargs,
+        )
+        plotter.render(ax)
+        return plotter
@@ -1,17 +1,29 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any, ClassVar
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba
+from matplotlib.lines import Line2D
+from pandas.api.types import is_numeric_dtype
 
 from dr_plotter import consts
 from dr_plotter.configs import GroupingConfig
 from dr_plotter.theme import LINE_THEME, Theme
-from dr_plotter.types import ComponentSchema, Phase, VisualChannel
+from dr_plotter.types import ComponentSchema, GroupInfo, Phase, VisualChannel
 
 from .base import BasePlotter
 
+# Above this many groups a single collection replaces one Line2D per group.
+BATCHED_LINES_MIN_GROUPS = 100
+# Streamed lines are split into artists of about this many points, so an
+# append only redraws the newest one.
+STREAM_CHUNK_POINTS = 10_000
+
 
 class LinePlotter(BasePlotter):
     plotter_name: str = "line"
@@ -24,6 +36,7 @@ class LinePlotter(BasePlotter):
         "alpha",
     }
     default_theme: ClassVar[Theme] = LINE_THEME
+    data_limits: ClassVar[bool] = True
 
     component_schema: ClassVar[dict[Phase, ComponentSchema]] = {
         "plot": {
@@ -55,6 +68,126 @@ class LinePlotter(BasePlotter):
     ) -> None:
         super().__init__(data, grouping_cfg, theme, figure_manager, **kwargs)
         self.styler.register_post_processor("line", "lines", self._style_lines)
+        self._streams: dict[tuple, _LineChunks | _SegmentChunks] = {}
+        self._line_batches: dict[tuple[str, str], list[_LineBatch]] = {}
+
+    def append(self, data: pd.DataFrame) -> None:
+        # Streams new rows into the lines drawn by render(); raw_data and
+        # plot_data only ever hold the latest chunk.
+        assert hasattr(self, "current_axis"), "append() requires a rendered plot"
+        ax = self.current_axis
+        self.raw_data = data
+        self.prepare_data()
+
+        if self._has_groups:
+            groups = self._process_grouped_data()
+        else:
+            groups = [(None, self.plot_data)]
+
+        new_groups = False
+        touched: dict[_LineBatch, None] = {}
+        for index, group_info in enumerate(groups):
+            group_context = self._setup_group_context(group_info, index, len(groups))
+            group_data = group_context["data"]
+            if group_data.empty:
+                continue
+
+            stream = self._streams.get(tuple(group_context["values"].items()))
+            if stream is None:
+                if self._has_groups:
+                    plot_kwargs = self._resolve_group_plot_kwargs(group_context)
+                else:
+                    plot_kwargs = self.styler.get_component_styles(
+                        self.__class__.plotter_name
+                    ).get("main", {})
+                self._draw(ax, group_data, **plot_kwargs)
+                new_groups = True
+                continue
+
+            group_data = group_data.sort_values(consts.X_COL_NAME)
+            x = group_data[consts.X_COL_NAME].to_numpy()
+            y = group_data[consts.Y_COL_NAME].to_numpy()
+            if isinstance(stream, _LineChunks):
+                stream.extend(x, y)
+                line = stream.lines[0]
+                ax.update_datalim(np.column_stack([line.convert_xunits(x), y]))
+            else:
+                points = np.column_stack([x, y]).astype(float, copy=False)
+                touched.update(dict.fromkeys(stream.extend(points)))
+                ax.update_datalim(points)
+
+        for batch in touched:
+            batch.draw(ax)
+        if self._has_groups:
+            self.styler.clear_group_context()
+        ax.autoscale_view()
+        if new_groups and self.figure_manager is not None:
+            self.figure_manager.legend_manager.refresh([ax])
+
+    def _render_with_grouped_method(self, ax: Any) -> None:
+        groups = self._process_grouped_data()
+        if self._use_batched_lines(len(groups)):
+            self._draw_batched(ax, groups)
+        else:
+            self._render_groups(ax, groups)
+
+    def _use_batched_lines(self, n_groups: int) -> bool:
+        # Collections have no markers or unit conversion, so only plain
+        # numeric lines can share one artist. Colors must come from the theme
+        # rather than the axes' color cycle, which color=None falls back to.
+        batchable = (
+            "marker" not in self.grouping_params.active_channels
+            and self._resolve_phase_config("main").get("marker") in (None, "", "None")
+            and not ("color" in self.kwargs and self.kwargs["color"] is None)
+            and is_numeric_dtype(self.plot_data[consts.X_COL_NAME])
+            and is_numeric_dtype(self.plot_data[consts.Y_COL_NAME])
+        )
+        batch_lines = self.kwargs.get("batch_lines")
+        if batch_lines is None:
+            return batchable and n_groups > BATCHED_LINES_MIN_GROUPS
+        assert batchable or not batch_lines, (
+            "batch_lines requires numeric x and y, no markers, and theme colors"
+        )
+        return bool(batch_lines)
+
+    def _draw_batched(self, ax: plt.Axes, groups: Sequence[GroupInfo]) -> None:
+        for group_index, group_info in enumerate(groups):
+            group_context = self._setup_group_context(
+                group_info, group_index, len(groups)
+            )
+            plot_kwargs = self._resolve_group_plot_kwargs(group_context)
+            label = plot_kwargs.pop("label", None)
+            data_sorted = group_context["data"].sort_values(consts.X_COL_NAME)
+            config = self._resolve_phase_config("main", data=data_sorted, **plot_kwargs)
+
+            # The proxy normalizes styles exactly as ax.plot would and stands in
+            # for the group in the legend.
+            proxy = Line2D([], [], **config)
+            if proxy.get_linestyle() in ("-", "solid"):
+                caps = (proxy.get_solid_capstyle(), proxy.get_solid_joinstyle())
+            else:
+                caps = (proxy.get_dash_capstyle(), proxy.get_dash_joinstyle())
+            batches = self._line_batches.setdefault(caps, [_LineBatch(*caps)])
+            points = np.column_stack(
+                [
+                    data_sorted[consts.X_COL_NAME].to_numpy(dtype=float),
+                    data_sorted[consts.Y_COL_NAME].to_numpy(dtype=float),
+                ]
+            )
+            position = batches[0].add(
+                points,
+                to_rgba(proxy.get_color(), proxy.get_alpha()),
+                proxy.get_linestyle(),
+                proxy.get_linewidth(),
+            )
+            key = tuple(self.styler.group_values.items())
+            self._streams[key] = _SegmentChunks(batches, position)
+            if self._should_create_legend():
+                self._register_line_legend_entries(proxy, label)
+
+        for (batch,) in self._line_batches.values():
+            batch.draw(ax)
+        ax.autoscale_view()
 
     def _style_lines(self, lines: Any, styles: dict[str, Any]) -> None:
         for line in lines:
@@ -83,6 +216,7 @@ class LinePlotter(BasePlotter):
         lines = ax.plot(
             data_sorted[consts.X_COL_NAME], data_sorted[consts.Y_COL_NAME], **config
         )
+        self._streams[tuple(self.styler.group_values.items())] = _LineChunks(lines[0])
 
         artists = {"lines": lines}
         self.styler.apply_post_processing("line", artists)
@@ -94,13 +228,224 @@ class LinePlotter(BasePlotter):
             self._apply_styling(self.current_axis)
             return
 
-        if self.figure_manager and label and lines:
+        if lines:
             line = lines[0] if isinstance(lines, list) else lines
-            for channel in self.grouping_params.active_channels_ordered:
-                entry = self.styler.create_legend_entry(
-                    line, label, self.current_axis, explicit_channel=channel
-                )
-                if entry:
-                    self.figure_manager.register_legend_entry(entry)
+            self._register_line_legend_entries(line, label)
 
         self._apply_styling(self.current_axis)
+
+    def _register_line_legend_entries(self, line: Line2D, label: str | None) -> None:
+        if not (self.figure_manager and label):
+            return
+        for channel in self.grouping_params.active_channels_ordered:
+            entry = self.styler.create_legend_entry(
+                line, label, self.current_axis, explicit_channel=channel
+            )
+            if entry:
+                self.figure_manager.register_legend_entry(entry)
+
+
+class _LineBatch:
+    # Segments drawn by one open, unfilled PolyCollection. It draws exactly like
+    # a LineCollection, but legend placement with loc="best" only avoids the
+    # paths of lines, patches and PolyCollections. Line2D caps solid and dashed
+    # lines differently, so each cap and join style gets its own batches.
+    def __init__(self, capstyle: str, joinstyle: str) -> None:
+        self.capstyle = capstyle
+        self.joinstyle = joinstyle
+        self.segments: list[np.ndarray] = []
+        self.colors: list[tuple[float, float, float, float]] = []
+        self.linestyles: list[Any] = []
+        self.linewidths: list[float] = []
+        self.size = 0
+        self.collection: PolyCollection | None = None
+
+    def add(
+        self,
+        points: np.ndarray,
+        color: tuple[float, float, float, float],
+        linestyle: Any,
+        linewidth: float,
+    ) -> int:
+        self.segments.append(points)
+        self.colors.append(color)
+        self.linestyles.append(linestyle)
+        self.linewidths.append(linewidth)
+        self.size += len(points)
+        return len(self.segments) - 1
+
+    def style(self, position: int) -> tuple[Any, Any, float]:
+        return (
+            self.colors[position],
+            self.linestyles[position],
+            self.linewidths[position],
+        )
+
+    def draw(self, ax: plt.Axes) -> None:
+        if self.collection is not None:
+            self.collection.set_verts(self.segments, closed=False)
+            return
+        self.collection = PolyCollection(
+            self.segments,
+            closed=False,
+            facecolors="none",
+            edgecolors=self.colors,
+            linestyles=self.linestyles,
+            linewidths=self.linewidths,
+            capstyle=self.capstyle,
+            joinstyle=self.joinstyle,
+            antialiaseds=plt.rcParams["lines.antialiased"],
+        )
+        ax.add_collection(self.collection)
+
+
+class _LineChunks:
+    # A streamed group drawn as a run of Line2D chunks. Appends only update the
+    # last chunk, and a full chunk is followed by a new one starting at its
+    # last point, so an append costs O(chunk) rather than O(history).
+    def __init__(self, line: Line2D) -> None:
+        self.lines = [line]
+        self.series = _SeriesBuffer(line.get_xdata(), line.get_ydata())
+
+    def extend(self, x: np.ndarray, y: np.ndarray) -> None:
+        if not self.series.follows(x):
+            self._merge(x, y)
+            return
+        while len(x):
+            if self.series.size >= STREAM_CHUNK_POINTS:
+                self._start_chunk()
+            room = STREAM_CHUNK_POINTS - self.series.size
+            self.lines[-1].set_data(*self.series.extend(x[:room], y[:room]))
+            x, y = x[room:], y[room:]
+
+    def _start_chunk(self) -> None:
+        previous = self.lines[-1]
+        line = Line2D([], [])
+        line.update_from(previous)
+        line.set_zorder(previous.get_zorder())
+        # The first chunk alone stands for the group in legends.
+        line.set_label("_nolegend_")
+        previous.axes.add_line(line)
+        self.lines.append(line)
+        self.series = _SeriesBuffer(*self.series.last_rows())
+
+    def _merge(self, x: np.ndarray, y: np.ndarray) -> None:
+        # Chunks ahead of out-of-order rows go stale, so the whole history is
+        # merged back into the first chunk; later appends start new chunks.
+        self.series = _SeriesBuffer(
+            _join_chunks([line.get_xdata() for line in self.lines]),
+            _join_chunks([line.get_ydata() for line in self.lines]),
+        )
+        for line in self.lines[1:]:
+            line.remove()
+        del self.lines[1:]
+        self.lines[0].set_data(*self.series.extend(x, y))
+
+
+class _SegmentChunks:
+    # A streamed group in a batched plot: one segment in each batch it was
+    # extended in, the newest last. Appends only touch the newest batch of the
+    # group's cap style, and a full batch is followed by a new one.
+    def __init__(self, batches: list[_LineBatch], position: int) -> None:
+        self.batches = batches
+        self.pieces = [(batches[-1], position)]
+        self.series = _SeriesBuffer(batches[-1].segments[position])
+
+    def extend(self, points: np.ndarray) -> list[_LineBatch]:
+        if not self.series.follows(points):
+            return self._merge(points)
+        batch, position = self.pieces[-1]
+        live = self.batches[-1]
+        if batch is not live or live.size >= STREAM_CHUNK_POINTS:
+            if live.size >= STREAM_CHUNK_POINTS:
+                live = _LineBatch(live.capstyle, live.joinstyle)
+                self.batches.append(live)
+            first_batch, first_position = self.pieces[0]
+            (seed,) = self.series.last_rows()
+            batch, position = live, live.add(seed, *first_batch.style(first_position))
+            self.pieces.append((batch, position))
+            self.series = _SeriesBuffer(seed)
+        (batch.segments[position],) = self.series.extend(points)
+        batch.size += len(points)
+        return [batch]
+
+    def _merge(self, points: np.ndarray) -> list[_LineBatch]:
+        # As for _LineChunks, out-of-order rows fold the history back into the
+        # first segment and empty the later ones.
+        self.series = _SeriesBuffer(
+            _join_chunks([batch.segments[position] for batch, position in self.pieces])
+        )
+        (merged,) = self.series.extend(points)
+        for batch, position in self.pieces[1:]:
+            batch.segments[position] = merged[:0]
+        first_batch, first_position = self.pieces[0]
+        first_batch.segments[first_position] = merged
+        first_batch.size += len(points)
+        touched = [batch for batch, _ in self.pieces]
+        del self.pieces[1:]
+        return touched
+
+
+class _SeriesBuffer:
+    # Grows geometrically so appending k points costs O(k) amortized. Holds
+    # either separate x and y arrays or one (N, 2) array of points, with rows
+    # kept sorted by x.
+    def __init__(self, *arrays: Any) -> None:
+        self._arrays = [np.asarray(values) for values in arrays]
+        self.size = len(self._arrays[0])
+
+    def follows(self, new: np.ndarray) -> bool:
+        # Whether rows with these x values can go after the buffered ones.
+        x = _x_values(new)
+        return not (len(x) and self.size) or not (
+            x.min() < _x_values(self._arrays[0])[self.size - 1]
+        )
+
+    def last_rows(self) -> tuple[np.ndarray, ...]:
+        return tuple(
+            values[self.size - 1 : self.size].copy() for values in self._arrays
+        )
+
+    def extend(self, *arrays: np.ndarray) -> tuple[np.ndarray, ...]:
+        x = _x_values(arrays[0])
+        if not self.follows(arrays[0]):
+            merged = [
+                np.concatenate([values[: self.size], new])
+                for values, new in zip(self._arrays, arrays, strict=True)
+            ]
+            order = np.argsort(_x_values(merged[0]), kind="stable")
+            self._arrays = [values[order] for values in merged]
+            self.size = len(order)
+            return tuple(self._arrays)
+
+        end = self.size + len(x)
+        capacity = len(self._arrays[0])
+        if end > capacity or any(
+            values.dtype != np.result_type(values, new)
+            for values, new in zip(self._arrays, arrays, strict=True)
+        ):
+            capacity = max(end, 2 * capacity)
+            self._arrays = [
+                self._grow(values, new, capacity)
+                for values, new in zip(self._arrays, arrays, strict=True)
+            ]
+        for values, new in zip(self._arrays, arrays, strict=True):
+            values[self.size : end] = new
+        self.size = end
+        return tuple(values[: self.size] for values in self._arrays)
+
+    def _grow(self, values: np.ndarray, new: np.ndarray, capacity: int) -> np.ndarray:
+        grown = np.empty(
+            (capacity, *values.shape[1:]), dtype=np.result_type(values, new)
+        )
+        grown[: self.size] = values[: self.size]
+        return grown
+
+
+def _join_chunks(chunks: list[np.ndarray]) -> np.ndarray:
+    # Every chunk after the first starts with its predecessor's last row.
+    return np.concatenate([chunks[0], *(chunk[1:] for chunk in chunks[1:])])
+
+
+def _x_values(values: np.ndarray) -> np.ndarray:
+    return values if values.ndim == 1 else values[:, 0]
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from typing import Any, ClassVar
 
+import matplotlib as mpl
 import numpy as np
 import pandas as pd
+from matplotlib.colors import to_rgba
 from matplotlib.lines import Line2D
+from matplotlib.markers import MarkerStyle
 
 from dr_plotter import consts
 from dr_plotter.configs import GroupingConfig
@@ -15,7 +18,10 @@ from dr_plotter.types import (
     VisualChannel,
 )
 
-from .base import BasePlotter
+from .base import BasePlotter, GroupedRows
+
+BATCHED_POINTS_MIN_GROUPS = 100
+BATCHED_POINTS_MAX_GROUP_SIZE = 150
 
 
 class ScatterPlotter(BasePlotter):
@@ -23,6 +29,7 @@ class ScatterPlotter(BasePlotter):
     plotter_params: ClassVar[list[str]] = []
     enabled_channels: ClassVar[set[VisualChannel]] = {"hue", "size", "marker", "alpha"}
     default_theme: ClassVar[Theme] = SCATTER_THEME
+    data_limits: ClassVar[bool] = True
 
     component_schema: ClassVar[dict[Phase, ComponentSchema]] = {
         "plot": {
@@ -112,6 +119,121 @@ class ScatterPlotter(BasePlotter):
 
         return computed
 
+    def _render_with_grouped_method(self, ax: Any) -> None:
+        groups = self._process_grouped_data()
+        if self._use_batched_points(groups):
+            self._draw_batched(ax, groups)
+        else:
+            self._render_groups(ax, groups)
+
+    def _use_batched_points(self, groups: Any) -> bool:
+        # Colors must be known up front to be merged into one collection.
+        static_styles = self._resolve_static_phase_styles("main")
+        batchable = (
+            isinstance(groups, GroupedRows)
+            and static_styles.get("c") is None
+            and (
+                static_styles.get("color") is not None
+                or "hue" in self.grouping_params.active_channels
+            )
+        )
+        batch_points = self.kwargs.get("batch_points")
+        if batch_points is None:
+            # Single-style collections take Agg's fast marker path, which
+            # beats merging once groups hold more than a few points each.
+            return (
+                batchable
+                and len(groups) > BATCHED_POINTS_MIN_GROUPS
+                and len(groups.data) <= BATCHED_POINTS_MAX_GROUP_SIZE * len(groups)
+            )
+        assert batchable or not batch_points, (
+            "batch_points requires categorical groups with a color or hue"
+        )
+        return bool(batch_points)
+
+    def _draw_batched(self, ax: Any, groups: GroupedRows) -> None:
+        # Group styles become lookup tables indexed by group, and each marker
+        # shape is drawn as one collection with per-point colors and sizes.
+        # Group data is only taken when sizes are computed per point.
+        needs_data = "size" in self.grouping_params.active_channels
+        faces, edges, widths, sizes = [], [], [], []
+        members_by_marker: dict[Any, list[int]] = {}
+        for group_index in range(len(groups)):
+            group_info = (
+                groups[group_index] if needs_data else (groups.names[group_index], None)
+            )
+            group_context = self._setup_group_context(
+                group_info, group_index, len(groups)
+            )
+            plot_kwargs = self._resolve_group_plot_kwargs(group_context)
+            label = plot_kwargs.pop("label", None)
+            config = self._resolve_phase_config(
+                "main", data=group_context["data"], **plot_kwargs
+            )
+
+            marker = config.get("marker", mpl.rcParams["scatter.marker"])
+            alpha = config.get("alpha")
+            face = to_rgba(config["color"], alpha)
+            edgecolors = config.get("edgecolors", mpl.rcParams["scatter.edgecolors"])
+            edge = face if str(edgecolors) == "face" else to_rgba(edgecolors, alpha)
+            if not MarkerStyle(marker).is_filled():
+                # Unfilled markers are stroked in the face color.
+                edge = face
+            faces.append(face)
+            edges.append(edge)
+            widths.append(config.get("linewidths"))
+            size = np.broadcast_to(
+                np.asarray(config.get("s", mpl.rcParams["lines.markersize"] ** 2)),
+                len(groups.positions[group_index]),
+            )
+            sizes.append(size)
+            members_by_marker.setdefault(marker, []).append(group_index)
+
+            if self._should_create_legend() and self.figure_manager and label:
+                proxy_size = size[0] if len(size) else None
+                self._register_proxy_entries(face, edge, proxy_size, label)
+        self.styler.clear_group_context()
+
+        x = self.plot_data[consts.X_COL_NAME]
+        y = self.plot_data[consts.Y_COL_NAME]
+        faces, edges = np.array(faces), np.array(edges)
+        for marker, members in members_by_marker.items():
+            rows = np.concatenate([groups.positions[i] for i in members])
+            codes = np.repeat(members, [len(groups.positions[i]) for i in members])
+            filled = MarkerStyle(marker).is_filled()
+            scatter_kwargs = {
+                "marker": marker,
+                "s": np.concatenate([sizes[i] for i in members]),
+                "color": faces[codes],
+            }
+            member_widths = [widths[i] for i in members]
+            if any(width is not None for width in member_widths):
+                # Groups without a width take the default ax.scatter gives them.
+                default_width = mpl.rcParams[
+                    "patch.linewidth" if filled else "lines.linewidth"
+                ]
+                member_widths = np.array(
+                    [
+                        default_width if width is None else width
+                        for width in member_widths
+                    ],
+                    dtype=float,
+                )
+                # Per-point widths make matplotlib build a dash pattern per
+                # point, so a shared width stays scalar.
+                scatter_kwargs["linewidths"] = (
+                    member_widths[0]
+                    if np.all(member_widths == member_widths[0])
+                    else np.repeat(
+                        member_widths,
+                        [len(groups.positions[i]) for i in members],
+                    )
+                )
+            if filled:
+                scatter_kwargs["edgecolors"] = edges[codes]
+            collection = ax.scatter(x.take(rows), y.take(rows), **scatter_kwargs)
+            self.styler.apply_post_processing("scatter", {"collection": collection})
+
     def _draw(self, ax: Any, data: pd.DataFrame, **kwargs: Any) -> None:
         label = kwargs.pop("label", None)
         config = self._resolve_phase_config("main", data=data, **kwargs)
@@ -130,27 +252,32 @@ class ScatterPlotter(BasePlotter):
             return
 
         if self.figure_manager and label and collection:
-            for channel in self.grouping_params.active_channels_ordered:
-                proxy = self._create_channel_specific_proxy(collection)
-                if proxy:
-                    entry = self.styler.create_legend_entry(
-                        proxy, label, self.current_axis, explicit_channel=channel
-                    )
-                    if entry:
-                        self.figure_manager.register_legend_entry(entry)
-
-    def _create_channel_specific_proxy(self, collection: Any) -> Any | None:
-        facecolors = collection.get_facecolors()
-        edgecolors = collection.get_edgecolors()
-        sizes = collection.get_sizes()
-        assert len(facecolors) > 0
-        assert len(edgecolors) > 0
-
-        face_color = facecolors[0]
-        edge_color = edgecolors[0]
+            facecolors = collection.get_facecolors()
+            edgecolors = collection.get_edgecolors()
+            sizes = collection.get_sizes()
+            assert len(facecolors) > 0
+            assert len(edgecolors) > 0
+            size = sizes[0] if len(sizes) > 0 else None
+            self._register_proxy_entries(facecolors[0], edgecolors[0], size, label)
+
+    def _register_proxy_entries(
+        self, face_color: Any, edge_color: Any, size: float | None, label: str
+    ) -> None:
+        for channel in self.grouping_params.active_channels_ordered:
+            proxy = self._create_channel_specific_proxy(face_color, edge_color, size)
+            if proxy:
+                entry = self.styler.create_legend_entry(
+                    proxy, label, self.current_axis, explicit_channel=channel
+                )
+                if entry:
+                    self.figure_manager.register_legend_entry(entry)
+
+    def _create_channel_specific_proxy(
+        self, face_color: Any, edge_color: Any, size: float | None
+    ) -> Any | None:
         marker_size = self.styler.get_style("marker_size", 8)
-        if len(sizes) > 0:
-            marker_size = np.sqrt(sizes[0] / np.pi) * 2
+        if size is not None:
+            marker_size = np.sqrt(size / np.pi) * 2
         marker_style = "o"
         if self.styler.group_values:
             styles = self.style_engine.get_styles_for_group(
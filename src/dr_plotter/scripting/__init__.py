@@ -17,6 +17,8 @@ from .utils import (
     create_and_render_plot,
     execute_cli_workflow,
     load_dataset,
+    read_dataset_columns,
+    required_columns,
     show_or_save_plot,
     validate_args,
     validate_columns,
@@ -35,6 +37,8 @@ __all__ = [
     "load_config",
     "load_dataset",
     "matrix_data",
+    "read_dataset_columns",
+    "required_columns",
     "show_or_save_plot",
     "validate_args",
     "validate_columns",
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import click
+import matplotlib
+import matplotlib.pyplot as plt
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as pads
+import pyarrow.parquet as pq
+import yaml
+
+from dr_plotter.figure_manager import FigureManager
+from dr_plotter.figure_saver import DEFAULT_SAVE_DPI, FigureSaver
+from dr_plotter.scripting.cli_framework import (
+    build_configs,
+    validate_layout_options,
+    validate_unused_parameters,
+)
+from dr_plotter.scripting.utils import (
+    build_parquet_filter,
+    read_dataset_columns,
+    required_columns,
+    validate_columns,
+)
+
+if TYPE_CHECKING:
+    from dr_plotter.configs import FacetingConfig
+
+BATCH_SPEC_KEYS = {"dataset", "plot_type", "name", "save_dir", "dpi"}
+DEFAULT_PLOT_TYPE = "scatter"
+DEFAULT_SAVE_DIR = "./plots"
+
+
+@dataclass
+class BatchPlotResult:
+    name: str
+    path: Path
+    load_seconds: float
+    plot_seconds: float
+    save_seconds: float
+
+    @property
+    def total_seconds(self) -> float:
+        return self.load_seconds + self.plot_seconds + self.save_seconds
+
+
+def load_manifest(manifest_path: str | Path) -> list[dict[str, Any]]:
+    manifest_path = Path(manifest_path)
+    assert manifest_path.exists(), f"Manifest not found: {manifest_path}"
+    with manifest_path.open() as f:
+        manifest = yaml.safe_load(f)
+    assert isinstance(manifest, dict) and manifest.get("plots"), (
+        "Manifest must define a non-empty 'plots' list"
+    )
+
+    defaults = manifest.get("defaults") or {}
+    specs = []
+    for index, plot_spec in enumerate(manifest["plots"]):
+        spec = {**defaults, **plot_spec}
+        assert "dataset" in spec, f"Plot {index} in manifest has no dataset"
+        dataset = Path(spec["dataset"]).expanduser()
+        if not dataset.is_absolute():
+            dataset = manifest_path.parent / dataset
+        spec["dataset"] = str(dataset)
+        spec.setdefault("name", f"dr_plotter_{dataset.stem}_{index:03d}")
+        specs.append(spec)
+    return specs
+
+
+def validate_spec(spec: dict[str, Any]) -> None:
+    plot_args = _plot_args(spec)
+    validate_layout_options(click.get_current_context(silent=True), **plot_args)
+    _, unused_kwargs = build_configs(plot_args)
+    validate_unused_parameters(unused_kwargs, {"pause"})
+    validate_columns(read_dataset_columns(spec["dataset"]), plot_args)
+
+
+def run_batch(
+    specs: list[dict[str, Any]], workers: int | None = None
+) -> list[BatchPlotResult]:
+    with tempfile.TemporaryDirectory(prefix="dr_plotter_batch_") as shared_dir:
+        shared = share_datasets(specs, Path(shared_dir))
+        tasks = [(spec, shared[spec["dataset"]]) for spec in specs]
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_batch_worker
+        ) as pool:
+            return list(pool.map(_render_spec, tasks))
+
+
+def share_datasets(specs: list[dict[str, Any]], directory: Path) -> dict[str, Path]:
+    columns_by_dataset: dict[str, dict[str, None]] = {}
+    for spec in specs:
+        columns = columns_by_dataset.setdefault(spec["dataset"], {})
+        plot_args = _plot_args(spec)
+        plot_config, _ = build_configs(plot_args)
+        columns.update(dict.fromkeys(required_columns(plot_args, plot_config.faceting)))
+
+    shared = {}
+    for index, (dataset, columns) in enumerate(columns_by_dataset.items()):
+        schema_names = pq.read_schema(dataset).names
+        table = pq.read_table(
+            dataset, columns=[column for column in columns if column in schema_names]
+        )
+        shared_path = directory / f"dataset_{index:03d}.arrow"
+        with (
+            pa.OSFile(str(shared_path), "wb") as sink,
+            pa.ipc.new_file(sink, table.schema) as writer,
+        ):
+            writer.write_table(table)
+        shared[dataset] = shared_path
+    return shared
+
+
+def read_shared_dataset(
+    shared_path: Path, faceting: FacetingConfig | None, columns: list[str]
+) -> pd.DataFrame:
+    # The memory map is shared through the page cache; only this plot's
+    # projected and filtered rows are materialized as a DataFrame.
+    with pa.memory_map(str(shared_path)) as source:
+        table = pa.ipc.open_file(source).read_all()
+        filters = None
+        if faceting is not None:
+            filters = build_parquet_filter(faceting, table.schema)
+        projected = [column for column in columns if column in table.schema.names]
+        return (
+            pads.dataset(table).to_table(columns=projected, filter=filters).to_pandas()
+        )
+
+
+def _init_batch_worker() -> None:
+    matplotlib.use("Agg")
+
+
+def _render_spec(task: tuple[dict[str, Any], Path]) -> BatchPlotResult:
+    spec, shared_path = task
+    plot_args = _plot_args(spec)
+    start = time.perf_counter()
+    plot_config, _ = build_configs(plot_args)
+    df = read_shared_dataset(
+        shared_path,
+        plot_config.faceting,
+        required_columns(plot_args, plot_config.faceting),
+    )
+    loaded = time.perf_counter()
+
+    with FigureManager(plot_config) as fm:
+        fm.plot(df, spec.get("plot_type", DEFAULT_PLOT_TYPE))
+    plotted = time.perf_counter()
+
+    save_dir = Path(spec.get("save_dir") or DEFAULT_SAVE_DIR).expanduser()
+    save_dir.mkdir(parents=True, exist_ok=True)
+    path = save_dir / f"{spec['name']}.png"
+    # The figure is closed while its PNG is encoded and written.
+    with FigureSaver(max_workers=1) as saver:
+        saver.save(fm.fig, path, dpi=spec.get("dpi", DEFAULT_SAVE_DPI))
+        plt.close(fm.fig)
+    saved = time.perf_counter()
+
+    return BatchPlotResult(
+        name=spec["name"],
+        path=path,
+        load_seconds=loaded - start,
+        plot_seconds=plotted - loaded,
+        save_seconds=saved - plotted,
+    )
+
+
+def _plot_args(spec: dict[str, Any]) -> dict[str, Any]:
+    return {k: v for k, v in spec.items() if k not in BATCH_SPEC_KEYS}
@@ -157,15 +157,21 @@ def build_faceting_config(
             return value
         elif isinstance(value, (list, tuple)) and value:
             return parse_key_value_args(value)
+        elif isinstance(value, str) and value:
+            return parse_key_value_args([value])
         else:
             return None
 
     if "fixed" in relevant_kwargs:
         relevant_kwargs["fixed"] = parse_dimension_value(relevant_kwargs["fixed"])
-    if "order" in relevant_kwargs:
-        relevant_kwargs["order"] = parse_dimension_value(relevant_kwargs["order"])
-    if "exclude" in relevant_kwargs:
-        relevant_kwargs["exclude"] = parse_dimension_value(relevant_kwargs["exclude"])
+    # order and exclude take value lists, even when a single value is given.
+    for key in ["order", "exclude"]:
+        if key in relevant_kwargs:
+            parsed = parse_dimension_value(relevant_kwargs[key])
+            relevant_kwargs[key] = parsed and {
+                dim: val if isinstance(val, list) else [val]
+                for dim, val in parsed.items()
+            }
 
     if "no_auto_titles" in remaining_kwargs:
         relevant_kwargs["auto_titles"] = not remaining_kwargs.pop(
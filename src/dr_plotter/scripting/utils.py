@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import functools
+import operator
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable
@@ -7,8 +10,12 @@ from typing import TYPE_CHECKING, Any, Callable
 import click
 import matplotlib.pyplot as plt
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
 from dr_plotter import consts
+from dr_plotter.figure_saver import DEFAULT_SAVE_DPI
 from dr_plotter.scripting.cli_framework import (
     CLIConfig,
     build_configs,
@@ -17,18 +24,30 @@ from dr_plotter.scripting.cli_framework import (
 )
 
 if TYPE_CHECKING:
-    from dr_plotter.configs import PlotConfig
+    from concurrent.futures import Future
+
+    from dr_plotter.configs import FacetingConfig, PlotConfig
+    from dr_plotter.figure_saver import FigureSaver
 
 
 def show_or_save_plot(
-    fig: Any, save_dir: str | None, pause_duration: int, filename: str
+    fig: Any,
+    save_dir: str | None,
+    pause_duration: int,
+    filename: str,
+    saver: FigureSaver | None = None,
 ) -> None:
     if save_dir:
         save_path = Path(save_dir)
         save_path.mkdir(parents=True, exist_ok=True)
         savename = save_path / f"{filename}.png"
-        fig.savefig(savename, dpi=300)
-        print(f"Plot saved to {savename}")
+        if saver is None:
+            fig.savefig(savename, dpi=DEFAULT_SAVE_DPI)
+            print(f"Plot saved to {savename}")
+        else:
+            saver.save(fig, savename, dpi=DEFAULT_SAVE_DPI).add_done_callback(
+                _report_saved
+            )
     else:
         plt.show(block=False)
         plt.pause(pause_duration)
@@ -36,6 +55,11 @@ def show_or_save_plot(
     plt.close(fig)
 
 
+def _report_saved(future: Future[Path]) -> None:
+    if future.exception() is None:
+        print(f"Plot saved to {future.result()}")
+
+
 def create_and_render_plot(
     ax: Any, plotter_class: Any, plotter_args: Any, **kwargs: Any
 ) -> None:
@@ -43,23 +67,116 @@ def create_and_render_plot(
     plotter.render(ax)
 
 
-def load_dataset(file_path: str) -> pd.DataFrame:
-    path = Path(file_path).expanduser()
-    assert path.suffix == ".parquet", "Only parquet files are supported"
-    assert path.exists(), f"Dataset not found: {path}"
-    df = pd.read_parquet(path)
+def load_dataset(
+    file_path: str,
+    faceting: FacetingConfig | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    path = _dataset_path(file_path)
+    schema = pq.read_schema(path)
+    filters = None
+    if faceting is not None:
+        filters = build_parquet_filter(faceting, schema)
+    if columns is not None:
+        columns = [column for column in columns if column in schema.names]
+    df = pd.read_parquet(path, columns=columns, filters=filters)
     return df
 
 
-def validate_columns(df: pd.DataFrame, merged_args: Any) -> None:
-    column_options = [(key, merged_args.get(key)) for key in consts.COLUMN_KEYS]
-    for option_name, column_name in column_options:
-        if column_name and column_name not in df.columns:
-            available_cols = ", ".join(sorted(df.columns))
-            raise click.UsageError(
-                f"Column '{column_name}' for --{option_name} "
-                f"not found in dataset. Available columns: {available_cols}"
-            )
+def read_dataset_columns(file_path: str) -> list[str]:
+    return list(pq.read_schema(_dataset_path(file_path)).names)
+
+
+def _dataset_path(file_path: str) -> Path:
+    path = Path(file_path).expanduser()
+    assert path.suffix == ".parquet", "Only parquet files are supported"
+    assert path.exists(), f"Dataset not found: {path}"
+    return path
+
+
+def required_columns(
+    merged_args: dict[str, Any], faceting: FacetingConfig | None = None
+) -> list[str]:
+    # Filter dimensions come from the parsed FacetingConfig; the raw CLI
+    # values are still KEY=VALUE strings at this point.
+    columns: list[str] = []
+    for key in consts.COLUMN_KEYS:
+        value = merged_args.get(_arg_name(key))
+        columns.extend(value if isinstance(value, (list, tuple)) else [value])
+    if faceting is not None:
+        for attr in ["fixed", "order", "exclude"]:
+            columns.extend(getattr(faceting, attr, None) or {})
+    return list(dict.fromkeys(column for column in columns if column))
+
+
+def _arg_name(option_name: str) -> str:
+    return option_name.replace("-", "_")
+
+
+def build_parquet_filter(
+    config: FacetingConfig, schema: pa.Schema
+) -> pc.Expression | None:
+    expressions = []
+    for attr in ["fixed", "order", "exclude"]:
+        for dim, val in (getattr(config, attr, None) or {}).items():
+            if dim not in schema.names:
+                continue
+            values = val if isinstance(val, (list, tuple)) else [val]
+            scalars = _to_field_scalars(values, schema.field(dim).type)
+            if scalars is None:
+                continue
+            if attr == "fixed":
+                expressions.append(pc.field(dim) == scalars[0])
+            elif attr == "order":
+                expressions.append(pc.field(dim).isin(scalars))
+            else:
+                expressions.append(~pc.field(dim).isin(scalars))
+    if not expressions:
+        return None
+    return functools.reduce(operator.and_, expressions)
+
+
+def _to_field_scalars(values: list[Any], field_type: pa.DataType) -> list[Any] | None:
+    # Only push down predicates that keep exactly the rows the pandas filters in
+    # apply_dimensional_filters keep; anything else is left to that pass.
+    if pa.types.is_dictionary(field_type):
+        field_type = field_type.value_type
+    is_string_field = pa.types.is_string(field_type) or pa.types.is_large_string(
+        field_type
+    )
+    is_numeric_field = pa.types.is_integer(field_type) or pa.types.is_floating(
+        field_type
+    )
+    scalars = []
+    for value in values:
+        if isinstance(value, str) and is_string_field:
+            scalars.append(value)
+        elif (
+            isinstance(value, (int, float))
+            and not isinstance(value, bool)
+            and is_numeric_field
+        ):
+            try:
+                scalars.append(pa.scalar(value).cast(field_type).as_py())
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                return None
+        else:
+            return None
+    return scalars
+
+
+def validate_columns(available_columns: Iterable[str], merged_args: Any) -> None:
+    available = set(available_columns)
+    for option_name in consts.COLUMN_KEYS:
+        value = merged_args.get(_arg_name(option_name))
+        column_names = value if isinstance(value, (list, tuple)) else [value]
+        for column_name in column_names:
+            if column_name and column_name not in available:
+                available_cols = ", ".join(sorted(available))
+                raise click.UsageError(
+                    f"Column '{column_name}' for --{option_name} "
+                    f"not found in dataset. Available columns: {available_cols}"
+                )
 
 
 def validate_args(
@@ -70,7 +187,7 @@ def validate_args(
 ) -> None:
     validate_layout_options(click.get_current_context(), **merged_args)
     validate_unused_parameters(unused_kwargs, workflow_config.allowed_unused)
-    validate_columns(df, merged_args)
+    validate_columns(df.columns, merged_args)
 
 
 def apply_fixed_params(
@@ -87,6 +204,7 @@ def apply_fixed_params(
 @dataclass
 class CLIWorkflowConfig:
     data_loader: Callable[[dict], pd.DataFrame]
+    schema_loader: Callable[[dict], list[str]] | None = None
     default_params: dict[str, Any] = field(default_factory=dict)
     fixed_params: dict[str, Any] = field(default_factory=dict)
     allowed_unused: set[str] | None = None
@@ -101,7 +219,15 @@ def execute_cli_workflow(
     merged_args = apply_fixed_params(merged_args, workflow_config)
 
     plot_config, unused_kwargs = build_configs(merged_args)
-    df = workflow_config.data_loader(merged_args)
+    if workflow_config.schema_loader is not None:
+        validate_columns(workflow_config.schema_loader(merged_args), merged_args)
+    df = workflow_config.data_loader(
+        {
+            **merged_args,
+            "faceting": plot_config.faceting,
+            "columns": required_columns(merged_args, plot_config.faceting),
+        }
+    )
     validate_args(df, merged_args, unused_kwargs, workflow_config)
 
     return df, plot_config
@@ -42,6 +42,7 @@ class StyleApplicator:
         self.style_engine = style_engine
         self._component_schemas = self._load_component_schemas()
         self._post_processors: dict[str, Callable] = {}
+        self._static_styles: dict[tuple[str, str, Phase], dict[str, Any]] = {}
 
     def get_component_styles(
         self, plot_type: str, phase: Phase = "plot"
@@ -159,12 +160,18 @@ class StyleApplicator:
     def _resolve_component_styles(
         self, plot_type: str, component: str, attrs: set[str], phase: Phase = "plot"
     ) -> dict[str, Any]:
+        group_styles = self._get_group_styles_for_component(plot_type, component)
+        # Without group styles the result depends only on theme and kwargs, which
+        # are fixed for the lifetime of this applicator.
+        cache_key = (plot_type, component, phase)
+        if not group_styles and cache_key in self._static_styles:
+            return dict(self._static_styles[cache_key])
+
         base_styles = self._get_base_theme_styles(phase)
         plot_styles = self._get_plot_specific_theme_styles(plot_type, phase)
-        group_styles = self._get_group_styles_for_component(plot_type, component)
         component_kwargs = self._extract_component_kwargs(component, attrs)
 
-        return self._merge_style_precedence(
+        resolved_styles = self._merge_style_precedence(
             base_styles,
             plot_styles,
             group_styles,
@@ -173,6 +180,9 @@ class StyleApplicator:
             plot_type,
             component,
         )
+        if not group_styles:
+            self._static_styles[cache_key] = dict(resolved_styles)
+        return resolved_styles
 
     def _get_base_theme_styles(self, phase: Phase) -> dict[str, Any]:
         base_styles = {}
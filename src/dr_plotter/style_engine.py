@@ -1,17 +1,47 @@
 from __future__ import annotations
+from collections.abc import Iterable
 from typing import Any
 
+import numpy as np
+import pandas as pd
+
 from dr_plotter.channel_metadata import ChannelRegistry
 from dr_plotter.configs import CycleConfig, GroupingConfig
 from dr_plotter.theme import Theme
 
+ContinuousRange = dict[str, float]
+
+
+def continuous_range_key(channel: str, column: str) -> str:
+    return f"{channel}:{column}"
+
+
+def continuous_range(values: pd.Series) -> ContinuousRange | None:
+    array = pd.to_numeric(values).to_numpy(dtype=float, na_value=np.nan)
+    if array.size == 0 or np.isnan(array).all():
+        return None
+    min_val = float(np.nanmin(array))
+    max_val = float(np.nanmax(array))
+    return {"min": min_val, "max": max_val, "range": max_val - min_val}
+
+
+def merge_continuous_ranges(
+    ranges: Iterable[ContinuousRange | None],
+) -> ContinuousRange | None:
+    present = [r for r in ranges if r is not None]
+    if not present:
+        return None
+    min_val = min(r["min"] for r in present)
+    max_val = max(r["max"] for r in present)
+    return {"min": min_val, "max": max_val, "range": max_val - min_val}
+
 
 class StyleEngine:
     def __init__(self, theme: Theme, figure_manager: Any | None = None) -> None:
         self.theme = theme
         self.figure_manager = figure_manager
         self._local_cycle_config = CycleConfig(theme)
-        self._continuous_ranges: dict[str, dict[str, float]] = {}
+        self._continuous_ranges: dict[str, ContinuousRange] = {}
 
     @property
     def cycle_cfg(self) -> CycleConfig:
@@ -20,19 +50,20 @@ class StyleEngine:
         return self._local_cycle_config
 
     def set_continuous_range(
-        self, channel: str, column: str, values: list[float]
+        self, channel: str, column: str, values: pd.Series
     ) -> None:
-        if not values:
-            return
-        key = f"{channel}:{column}"
-        min_val = float(min(values))
-        max_val = float(max(values))
-        range_val = max_val - min_val
-        self._continuous_ranges[key] = {
-            "min": min_val,
-            "max": max_val,
-            "range": range_val,
-        }
+        range_info = continuous_range(values)
+        if range_info is not None:
+            self._continuous_ranges[continuous_range_key(channel, column)] = range_info
+
+    def _get_continuous_range(self, key: str) -> ContinuousRange | None:
+        # Ranges computed over the whole faceted frame keep every panel on the
+        # same scale; a plotter's own data is only the fallback.
+        if self.figure_manager:
+            shared = self.figure_manager.shared_continuous_ranges.get(key)
+            if shared is not None:
+                return shared
+        return self._continuous_ranges.get(key)
 
     def get_styles_for_group(
         self, group_values: dict[str, Any], grouping_cfg: GroupingConfig
@@ -61,11 +92,10 @@ class StyleEngine:
     def get_continuous_style(
         self, channel: str, column: str, value: float
     ) -> dict[str, Any]:
-        key = f"{channel}:{column}"
-        if key not in self._continuous_ranges:
+        range_info = self._get_continuous_range(continuous_range_key(channel, column))
+        if range_info is None:
             return {"size_mult": 1.0} if channel == "size" else {}
 
-        range_info = self._continuous_ranges[key]
         if range_info["range"] == 0:
             normalized = 0.5
         else:
@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from matplotlib.artist import Artist
+from matplotlib.collections import Collection
+from matplotlib.colors import to_rgba
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+
+from dr_plotter.cell_layout import apply_cell_layout
+from dr_plotter.configs import LayoutConfig, PlotConfig
+from dr_plotter.configs.legend_config import LegendStrategy
+from dr_plotter.consts import VISUAL_CHANNELS
+from dr_plotter.faceting.axis_sharing import Extent, apply_extent, shared_extents
+from dr_plotter.legend_manager import LegendEntry
+from dr_plotter.plotters.base import BasePlotter, PlotPipeline
+
+if TYPE_CHECKING:
+    from dr_plotter.faceting.facet_plan import FacetPlan
+    from dr_plotter.figure_manager import FigureManager
+
+DEFAULT_TILE_DPI = 300
+MIN_TILE_WORKERS = 2
+TILE_SUBPLOT_ADJUST = {"left": 0.2, "right": 0.95, "bottom": 0.15, "top": 0.88}
+SHARED_LEGEND_STRATEGIES = {
+    LegendStrategy.FIGURE_BELOW,
+    LegendStrategy.GROUPED_BY_CHANNEL,
+}
+
+Cell = tuple[int, int]
+CellExtents = tuple[Extent | None, Extent | None]
+
+
+@dataclass
+class TileJob:
+    manager_class: type
+    config: PlotConfig
+    layout: LayoutConfig
+    plot_type: str
+    plan: FacetPlan
+    data_subsets: dict[Cell, pd.DataFrame]
+    subplot_kwargs: dict[str, Any]
+    style_assignments: dict[Any, Any]
+    continuous_ranges: dict[str, Any]
+    sharex: str | None
+    sharey: str | None
+    collect_legend: bool
+
+
+# Set in each pool worker by _init_tile_worker.
+_WORKER_STATE: dict[str, TileJob] = {}
+
+
+def tile_workers(processes: int | None) -> int:
+    if processes is not None:
+        return processes
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def render_tiles(
+    fm: FigureManager,
+    plot_type: str,
+    plan: FacetPlan,
+    data_subsets: dict[Cell, pd.DataFrame],
+    subplot_kwargs: dict[str, Any],
+    extents: dict[str, dict[Cell, Extent | None]],
+    rect: tuple[float, float, float, float],
+    *,
+    processes: int | None = None,
+    dpi: float = DEFAULT_TILE_DPI,
+) -> tuple[np.ndarray, list[LegendEntry]]:
+    layout = fm.layout_config
+    rows, cols = layout.rows, layout.cols
+    left, bottom, right, top = rect
+    fig_width, fig_height = layout.figsize
+    tile_width = round(fig_width * (right - left) / cols * dpi)
+    tile_height = round(fig_height * (top - bottom) / rows * dpi)
+
+    share_kwargs = layout.combined_kwargs
+    tile_layout = replace(
+        layout,
+        rows=1,
+        cols=1,
+        figsize=(tile_width / dpi, tile_height / dpi),
+        tight_layout=False,
+        constrained_layout=False,
+        fast_layout=False,
+        figure_title=None,
+        x_labels=None,
+        y_labels=None,
+        xyscale=None,
+        figure_kwargs={**layout.figure_kwargs, "dpi": dpi},
+    )
+    job = TileJob(
+        manager_class=type(fm),
+        config=replace(fm.config, layout=tile_layout),
+        layout=layout,
+        plot_type=plot_type,
+        plan=plan,
+        data_subsets=data_subsets,
+        subplot_kwargs=subplot_kwargs,
+        style_assignments=_seed_style_assignments(fm, plan),
+        continuous_ranges=fm.shared_continuous_ranges,
+        sharex=_share_scope(share_kwargs.get("sharex")),
+        sharey=_share_scope(share_kwargs.get("sharey")),
+        collect_legend=fm.legend_config.legend_strategy in SHARED_LEGEND_STRATEGIES,
+    )
+
+    cells = list(data_subsets)
+    image = np.zeros((rows * tile_height, cols * tile_width, 4), dtype=np.uint8)
+    facecolor = layout.figure_kwargs.get("facecolor", plt.rcParams["figure.facecolor"])
+    image[...] = np.asarray(to_rgba(facecolor)) * 255
+    legend_entries: list[LegendEntry] = []
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=_tile_mp_context(),
+        initializer=_init_tile_worker,
+        initargs=(job,),
+    ) as pool:
+        shared = _shared_tile_extents(fm, job, extents, pool)
+        tiles = pool.map(
+            _render_tile,
+            cells,
+            [(shared["x"].get(c), shared["y"].get(c)) for c in cells],
+        )
+        for (row, col), (pixels, entries) in zip(cells, tiles):
+            image[
+                row * tile_height : (row + 1) * tile_height,
+                col * tile_width : (col + 1) * tile_width,
+            ] = pixels
+            legend_entries.extend(entries)
+    return image, legend_entries
+
+
+class TileMosaic(Artist):
+    # Blits the stitched uint8 tiles straight to the renderer; going through
+    # figimage/imshow resamples in floating point and multiplies peak memory.
+    def __init__(
+        self, image: np.ndarray, rect: tuple[float, float, float, float], dpi: float
+    ) -> None:
+        super().__init__()
+        self.image = image
+        self.rect = rect
+        self.dpi = dpi
+
+    def draw(self, renderer: Any) -> None:
+        if not self.get_visible():
+            return
+        left, bottom, _, _ = self.rect
+        x0, y0 = self.figure.transFigure.transform((left, bottom))
+        image = self.image
+        scale = renderer.dpi / self.dpi
+        if scale != 1:
+            height, width = image.shape[:2]
+            rows = (np.arange(round(height * scale)) / scale).astype(np.intp)
+            cols = (np.arange(round(width * scale)) / scale).astype(np.intp)
+            image = image[rows[:, None], cols]
+        gc = renderer.new_gc()
+        renderer.draw_image(gc, round(x0), round(y0), image[::-1])
+        gc.restore()
+
+
+def _tile_mp_context() -> Any:
+    # Forked workers inherit the job without pickling the theme or the data.
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def _init_tile_worker(job: TileJob) -> None:
+    _WORKER_STATE["job"] = job
+
+
+def _seed_style_assignments(fm: FigureManager, plan: FacetPlan) -> dict[Any, Any]:
+    cycle_config = fm.shared_cycle_config
+    if cycle_config is None:
+        return {}
+    for channel in VISUAL_CHANNELS:
+        column = getattr(plan.config, f"{channel}_by", None)
+        if column:
+            for value in plan.facet_index.values(column):
+                cycle_config.get_styled_value_for_channel(channel, value)
+    return cycle_config.export_assignments()
+
+
+def _share_scope(value: Any) -> str | None:
+    if value is True or value == "all":
+        return "all"
+    if value in ("row", "col"):
+        return value
+    return None
+
+
+def _shared_tile_extents(
+    fm: FigureManager,
+    job: TileJob,
+    extents: dict[str, dict[Cell, Extent | None]],
+    pool: ProcessPoolExecutor,
+) -> dict[str, dict[Cell, Extent]]:
+    # Limits are merged and applied with the same axis_sharing helpers as
+    # finalize_layout. FacetingConfig.share_x/share_y takes precedence; layout
+    # sharex/sharey stands in for matplotlib's shared autoscaling and falls
+    # back to each tile's data limits where the data gives no extent.
+    faceting_scopes = {
+        axis_name: getattr(job.plan.config, f"share_{axis_name}")
+        for axis_name in ("x", "y")
+    }
+    native_scopes = {"x": job.sharex, "y": job.sharey}
+    scopes = {
+        axis_name: faceting_scopes[axis_name] or native_scopes[axis_name]
+        for axis_name in ("x", "y")
+        if getattr(fm.layout_config, f"{axis_name}lim") is None
+    }
+    measure = any(
+        scope is not None
+        and faceting_scopes[axis_name] is None
+        and None in extents[axis_name].values()
+        for axis_name, scope in scopes.items()
+    )
+    cells = list(job.data_subsets)
+    measured = dict(zip(cells, pool.map(_measure_tile, cells))) if measure else {}
+
+    shared: dict[str, dict[Cell, Extent]] = {"x": {}, "y": {}}
+    for axis_name, scope in scopes.items():
+        if scope is None:
+            continue
+        cell_extents = extents[axis_name]
+        if measured and faceting_scopes[axis_name] is None:
+            index = 0 if axis_name == "x" else 1
+            cell_extents = {
+                cell: measured[cell][index] if extent is None else extent
+                for cell, extent in cell_extents.items()
+            }
+        shared[axis_name] = shared_extents(cell_extents, scope)
+    return shared
+
+
+def _measure_tile(cell: Cell) -> CellExtents:
+    fm = _draw_tile(cell)
+    bounds = fm.axes.dataLim
+    extents = (_finite_extent(bounds.intervalx), _finite_extent(bounds.intervaly))
+    plt.close(fm.fig)
+    return extents
+
+
+def _finite_extent(interval: np.ndarray) -> Extent | None:
+    low, high = (float(value) for value in interval)
+    if not (np.isfinite(low) and np.isfinite(high) and low <= high):
+        return None
+    return low, high
+
+
+def _render_tile(
+    cell: Cell, extents: CellExtents
+) -> tuple[np.ndarray, list[LegendEntry]]:
+    fm = _draw_tile(cell, extents)
+    fm.fig.canvas.draw()
+    pixels = np.asarray(fm.fig.canvas.buffer_rgba()).copy()
+    entries = []
+    if _WORKER_STATE["job"].collect_legend:
+        entries = [
+            replace(entry, artist=_detached_handle(entry.artist), axis=None)
+            for entry in fm.legend_manager.registry.get_unique_entries()
+        ]
+    plt.close(fm.fig)
+    return pixels, entries
+
+
+def _draw_tile(cell: Cell, extents: CellExtents | None = None) -> FigureManager:
+    job = _WORKER_STATE.get("job")
+    assert job is not None, "Tile worker was not initialized"
+    row, col = cell
+
+    fm = job.manager_class(job.config)
+    if fm.shared_cycle_config is not None:
+        fm.shared_cycle_config.load_assignments(job.style_assignments)
+    fm.shared_continuous_ranges.update(job.continuous_ranges)
+    fm.fig.subplots_adjust(**TILE_SUBPLOT_ADJUST)
+
+    pipeline = PlotPipeline(
+        BasePlotter.get_plotter(job.plot_type), figure_manager=fm, **job.subplot_kwargs
+    )
+    fm.draw_cell(pipeline, job.data_subsets[cell], row, col, job.plan)
+    apply_cell_layout(fm.axes, job.layout, row, col)
+
+    if extents is not None:
+        _apply_shared_extents(fm.axes, extents, job, row, col)
+    if fm.legend_config.legend_strategy == LegendStrategy.PER_AXES:
+        fm.legend_manager.finalize()
+    return fm
+
+
+def _apply_shared_extents(
+    ax: Any, extents: CellExtents, job: TileJob, row: int, col: int
+) -> None:
+    for axis, extent in zip((ax.xaxis, ax.yaxis), extents):
+        if extent is not None:
+            apply_extent(axis, extent)
+    # Inner tick labels are hidden as plt.subplots(sharex=..., sharey=...) would.
+    if job.sharex in ("all", "col") and row < job.layout.rows - 1:
+        ax.tick_params(labelbottom=False)
+    if job.sharey in ("all", "row") and col > 0:
+        ax.tick_params(labelleft=False)
+
+
+def _detached_handle(artist: Any) -> Any:
+    # Legend handles travel back to the parent process, so they must not drag
+    # their axes (and figure) along with them.
+    if isinstance(artist, Line2D):
+        return Line2D(
+            [],
+            [],
+            color=artist.get_color(),
+            linestyle=artist.get_linestyle(),
+            linewidth=artist.get_linewidth(),
+            marker=artist.get_marker(),
+            markersize=artist.get_markersize(),
+            markerfacecolor=artist.get_markerfacecolor(),
+            markeredgecolor=artist.get_markeredgecolor(),
+            alpha=artist.get_alpha(),
+        )
+    if isinstance(artist, Patch):
+        return Patch(
+            facecolor=artist.get_facecolor(),
+            edgecolor=artist.get_edgecolor(),
+            hatch=artist.get_hatch(),
+            alpha=artist.get_alpha(),
+        )
+    if isinstance(artist, Collection):
+        facecolors = artist.get_facecolor()
+        return Patch(
+            facecolor=facecolors[0] if len(facecolors) else None,
+            alpha=artist.get_alpha(),
+        )
+    return artist
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import matplotlib as mpl
+import matplotlib.image as mpimg
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+
+from dr_plotter import cli
+from dr_plotter.figure_saver import DEFAULT_SAVE_DPI
+from dr_plotter.scripting import batch
+
+mpl.use("Agg")
+
+
+@pytest.fixture
+def dataset(tmp_path: Path) -> Path:
+    path = tmp_path / "runs.parquet"
+    pd.DataFrame(
+        {
+            "step": [0, 1, 2] * 4,
+            "loss": [3.0, 2.0, 1.0] * 4,
+            "ds": ["a"] * 6 + ["b"] * 6,
+            "seed": [0, 0, 0, 1, 1, 1] * 2,
+        }
+    ).to_parquet(path)
+    return path
+
+
+@pytest.fixture
+def loaded(monkeypatch: pytest.MonkeyPatch) -> list[pd.DataFrame]:
+    frames: list[pd.DataFrame] = []
+    load_dataset = cli.load_dataset
+
+    def recording_load_dataset(*args: Any, **kwargs: Any) -> pd.DataFrame:
+        df = load_dataset(*args, **kwargs)
+        frames.append(df)
+        return df
+
+    monkeypatch.setattr(cli, "load_dataset", recording_load_dataset)
+    return frames
+
+
+@pytest.mark.parametrize(
+    ("option", "value", "column", "kept"),
+    [
+        ("--fixed", "seed=1", "seed", [1]),
+        ("--order", "ds=b", "ds", ["b"]),
+        ("--exclude", "ds=a", "ds", ["b"]),
+    ],
+)
+def test_dimension_options_filter_cli_reads(
+    dataset: Path,
+    loaded: list[pd.DataFrame],
+    tmp_path: Path,
+    option: str,
+    value: str,
+    column: str,
+    kept: list[Any],
+) -> None:
+    result = CliRunner().invoke(
+        cli.main,
+        [
+            str(dataset),
+            "--x",
+            "step",
+            "--y",
+            "loss",
+            "--wrap-by",
+            "ds",
+            option,
+            value,
+            "--save-dir",
+            str(tmp_path / "plots"),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    (df,) = loaded
+    assert sorted(df[column].unique()) == kept
+    assert len(df) == 6
+
+
+def test_batch_specs_save_at_the_shared_default_dpi(
+    dataset: Path, tmp_path: Path
+) -> None:
+    specs = [
+        {"dataset": str(dataset), "x": "step", "y": "loss", "plot_type": "line"},
+        {"dataset": str(dataset), "x": "step", "y": "loss", "plot_type": "line"},
+    ]
+    specs[1]["dpi"] = DEFAULT_SAVE_DPI // 6
+    shared = batch.share_datasets(specs, tmp_path)
+
+    shapes = []
+    for index, spec in enumerate(specs):
+        spec.update(name=f"plot_{index}", save_dir=str(tmp_path / "plots"))
+        result = batch._render_spec((spec, shared[spec["dataset"]]))
+        shapes.append(mpimg.imread(result.path).shape)
+
+    assert shapes[0] == (6 * shapes[1][0], 6 * shapes[1][1], 4)
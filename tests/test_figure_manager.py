@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import matplotlib as mpl
+import matplotlib.image as mpimg
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.lines import Line2D
+
+from dr_plotter import FigureManager
+from dr_plotter.configs import LegendConfig, PlotConfig
+from dr_plotter.figure_saver import FigureSaver
+from dr_plotter.legend_manager import LegendEntry
+
+mpl.use("Agg")
+
+
+@pytest.mark.parametrize(
+    "facets",
+    [{}, {"cols_by": "ds"}, {"rows_by": "ds"}, {"rows_by": "ds", "cols_by": "seed"}],
+)
+def test_render_batch_builds_one_figure(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, facets: dict[str, str]
+) -> None:
+    data = pd.DataFrame(
+        {
+            "step": np.tile(np.arange(5), 12),
+            "loss": np.linspace(0, 1, 60),
+            "ds": np.repeat(["a", "b", "c"], 20),
+            "seed": np.tile(np.repeat([0, 1], 5), 6),
+            "lr": np.tile(np.repeat(["x", "y", "z"], 5), 4),
+        }
+    )
+    builds = []
+    create_figure_axes = FigureManager._create_figure_axes
+
+    def counting_create_figure_axes(self: FigureManager) -> tuple:
+        builds.append(self)
+        return create_figure_axes(self)
+
+    monkeypatch.setattr(
+        FigureManager, "_create_figure_axes", counting_create_figure_axes
+    )
+
+    timings = FigureManager.render_batch(
+        data, "line", "lr", tmp_path, x="step", y="loss", dpi=20, **facets
+    )
+
+    assert len(timings) == 3
+    assert len(builds) == 1
+
+    # Each frame matches a fresh figure rendered and saved the same way.
+    for timing in timings:
+        fm = FigureManager()
+        fm.plot(data[data["lr"] == timing.value], "line", x="step", y="loss", **facets)
+        fm.finalize_layout()
+        with FigureSaver() as saver:
+            saver.save(fm.fig, tmp_path / "single.png", "png", dpi=20)
+        plt.close(fm.fig)
+        np.testing.assert_array_equal(
+            mpimg.imread(timing.path), mpimg.imread(tmp_path / "single.png")
+        )
+
+
+def test_panel_data_is_only_kept_when_updatable() -> None:
+    data = pd.DataFrame({"step": np.arange(10), "loss": np.linspace(0, 1, 10)})
+    chunk = pd.DataFrame({"step": [10, 11], "loss": [2.0, 3.0]})
+
+    fm = FigureManager()
+    fm.plot(data, "line", x="step", y="loss")
+    fm.append(0, 0, chunk)
+    (layer,) = fm._panel_layers[(0, 0)]
+    assert layer.data is None
+    assert not layer.appended
+    assert layer.extents["y"] == (0.0, 3.0)
+    with pytest.raises(AssertionError, match="updatable"):
+        fm.update(0, 0)
+
+    fm = FigureManager(updatable=True)
+    fm.plot(data, "line", x="step", y="loss")
+    fm.append(0, 0, chunk)
+    fm.update(0, 0)
+    (line,) = fm.get_axes(0, 0).lines
+    assert len(line.get_xdata()) == 12
+
+
+@pytest.mark.parametrize(
+    ("layout", "facets", "figsize"),
+    [
+        ({}, {}, (12.0, 8.0)),
+        ({"rows": 1, "cols": 3}, {"cols_by": "ds"}, (12.0, 4.0)),
+        (
+            {"rows": 2, "cols": 3, "figsize": (6, 4)},
+            {"rows_by": "seed", "cols_by": "ds"},
+            (12.0, 8.0),
+        ),
+    ],
+)
+def test_matching_layout_figure_has_layout_figsize(
+    layout: dict[str, Any], facets: dict[str, str], figsize: tuple[float, float]
+) -> None:
+    data = pd.DataFrame(
+        {
+            "step": np.tile(np.arange(5), 6),
+            "loss": np.linspace(0, 1, 30),
+            "ds": np.repeat(["a", "b", "c"], 10),
+            "seed": np.tile(np.repeat([0, 1], 5), 3),
+        }
+    )
+
+    fm = FigureManager(PlotConfig(layout=layout))
+    fm.plot(data, "line", x="step", y="loss", **facets)
+    assert fm.layout_config.figsize == figsize
+    assert tuple(fm.fig.get_size_inches()) == figsize
+
+    fm.plot(data, "line", x="step", y="loss", subplot_width=2.0, **facets)
+    assert tuple(fm.fig.get_size_inches()) == fm.layout_config.figsize
+
+
+def test_preset_layout_figure_is_built_after_facet_sizing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    data = pd.DataFrame(
+        {
+            "step": np.tile(np.arange(5), 3),
+            "loss": np.linspace(0, 1, 15),
+            "ds": np.repeat(["a", "b", "c"], 5),
+        }
+    )
+    builds = []
+    create_figure_axes = FigureManager._create_figure_axes
+
+    def recording_create_figure_axes(self: FigureManager) -> tuple:
+        layout = self.layout_config
+        builds.append(((layout.rows, layout.cols), layout.figsize))
+        return create_figure_axes(self)
+
+    monkeypatch.setattr(
+        FigureManager, "_create_figure_axes", recording_create_figure_axes
+    )
+
+    fm = FigureManager(PlotConfig(layout={"rows": 1, "cols": 3, "figsize": (6, 8)}))
+    fm._prepare_facets(data, x="step", y="loss", cols_by="ds")
+    assert fm._fig is None
+    fm.plot(data, "line", x="step", y="loss", cols_by="ds")
+    assert builds == [((1, 3), (12.0, 4.0))]
+
+    fm = FigureManager(PlotConfig(layout={"rows": 1, "cols": 3, "figsize": (6, 8)}))
+    fm.plot_tiled(data, "line", x="step", y="loss", cols_by="ds", processes=2, dpi=100)
+    assert builds == [((1, 3), (12.0, 4.0))]
+    # Tiles are rounded to whole pixels.
+    assert tuple(fm.fig.get_size_inches()) == pytest.approx(
+        fm.layout_config.figsize, abs=0.01
+    )
+
+
+def test_fast_layout_keeps_colorbars_inside_figure() -> None:
+    data = pd.DataFrame(
+        {
+            "x": np.tile(["a", "b", "a", "b"], 4),
+            "y": np.tile(["a", "a", "b", "b"], 4),
+            "value": np.arange(16) * 1000.0,
+            "ds": np.repeat(["a", "a", "b", "b"], 4),
+            "seed": np.repeat([0, 1, 0, 1], 4),
+        }
+    )
+
+    fm = FigureManager(PlotConfig(layout={"tight_layout": False, "fast_layout": True}))
+    fm.plot(
+        data,
+        "heatmap",
+        x="x",
+        y="y",
+        values="value",
+        rows_by="ds",
+        cols_by="seed",
+        colorbar_label="Value label",
+    )
+    fm.finalize_layout()
+
+    assert len(fm.fig.axes) == 8
+    fig_bbox = fm.fig.bbox
+    for ax in fm.fig.axes:
+        bbox = ax.get_tightbbox()
+        assert bbox.x0 >= fig_bbox.x0 and bbox.y0 >= fig_bbox.y0
+        assert bbox.x1 <= fig_bbox.x1 and bbox.y1 <= fig_bbox.y1
+    plt.close(fm.fig)
+
+
+def test_legend_entries_of_removed_axes_are_dropped() -> None:
+    data = pd.DataFrame(
+        {
+            "step": np.tile(np.arange(5), 3),
+            "loss": np.linspace(0, 1, 15),
+            "lr": np.repeat(["x", "y", "z"], 5),
+        }
+    )
+    fm = FigureManager(updatable=True)
+    fm.plot(data, "line", x="step", y="loss", hue_by="lr")
+    ax = fm.get_axes(0, 0)
+    registry = fm.legend_manager.registry
+
+    # A redraw removes the panel's auxiliary axes along with their entries.
+    aux = ax.inset_axes((0.6, 0.6, 0.3, 0.3))
+    fm._panel_aux_axes[(0, 0)] = [aux]
+    fm.register_legend_entry(LegendEntry(Line2D([], []), "aux", axis=aux))
+    fm.update(0, 0)
+    assert [entry.label for entry in registry.get_unique_entries()] == ["x", "y", "z"]
+    assert id(aux) not in registry._added
+
+    # Axes removed some other way are pruned on the next legend refresh.
+    other = fm.fig.add_axes((0.1, 0.1, 0.2, 0.2))
+    fm.register_legend_entry(LegendEntry(Line2D([], []), "other", axis=other))
+    other.remove()
+    fm.legend_manager.refresh([ax])
+    assert [entry.label for entry in registry.get_unique_entries()] == ["x", "y", "z"]
+    assert id(other) not in registry._added
+
+
+def test_redraws_replace_panel_legend_entries() -> None:
+    data = pd.DataFrame(
+        {
+            "step": np.tile(np.arange(5), 3),
+            "loss": np.linspace(0, 1, 15),
+            "lr": np.repeat(["x", "y", "z"], 5),
+        }
+    )
+    fm = FigureManager(updatable=True)
+    fm.plot(data, "line", x="step", y="loss", hue_by="lr")
+    ax = fm.get_axes(0, 0)
+    registry = fm.legend_manager.registry
+
+    # A long-running figure keeps one set of entries per panel, however often
+    # it is appended to and redrawn.
+    for step in range(5, 25):
+        chunk = data[data["step"] == 4].assign(step=step)
+        fm.append(0, 0, chunk)
+        fm.update(0, 0)
+    assert [entry.label for entry in registry.get_unique_entries()] == ["x", "y", "z"]
+    assert [len(entries) for entries in registry._added.values()] == [3]
+    assert list(registry._added) == [id(ax)]
+
+
+@pytest.mark.parametrize("strategy", ["figure", "grouped"])
+def test_updates_leave_one_figure_legend(strategy: str) -> None:
+    data = pd.DataFrame(
+        {
+            "step": np.tile(np.arange(5), 2),
+            "loss": np.linspace(0, 1, 10),
+            "lr": np.repeat(["x", "y"], 5),
+        }
+    )
+    config = PlotConfig(legend=LegendConfig(legend_strategy=strategy))
+
+    # Updates inside the context run before finalize_layout builds legends.
+    with FigureManager(config, updatable=True) as fm:
+        fm.plot(data, "line", x="step", y="loss", hue_by="lr")
+        fm.update(0, 0)
+    assert len(fm.fig.legends) == 1
+
+    fm.update(0, 0)
+    assert len(fm.fig.legends) == 1
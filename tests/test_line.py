@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+from typing import Any
+
+import matplotlib as mpl
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba
+from matplotlib.lines import Line2D
+
+from dr_plotter import FigureManager
+from dr_plotter.configs import LegendConfig, PlotConfig
+from dr_plotter.plotters import line as line_module
+
+mpl.use("Agg")
+
+
+def _grouped_lines(n_groups: int, group_size: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "x": np.tile(rng.permutation(group_size), n_groups),
+            "y": rng.random(n_groups * group_size),
+            "g": np.repeat([f"g{i:03d}" for i in range(n_groups)], group_size),
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"hue_by": "g"},
+        {"style_by": "g"},
+        {"alpha_by": "g"},
+        {"hue_by": "g", "linewidth": 3},
+    ],
+)
+def test_batched_lines_match_per_group_lines(kwargs: dict[str, Any]) -> None:
+    data = _grouped_lines(8, 5)
+
+    # Both plots share one axes and style coordinator, so groups get the same
+    # styles on either path.
+    fm = FigureManager()
+    fm.plot(data, "line", x="x", y="y", batch_lines=False, **kwargs)
+    ax = fm.get_axes(0, 0)
+    fm.plot(data, "line", x="x", y="y", batch_lines=True, **kwargs)
+    lines = ax.lines
+
+    # Groups are split into one collection per cap and join style, so each
+    # line is matched to its segment by data.
+    batched = {
+        path.vertices.tobytes(): (color, width)
+        for collection in ax.collections
+        for path, color, width in zip(
+            collection.get_paths(),
+            collection.get_edgecolors(),
+            collection.get_linewidths(),
+            strict=True,
+        )
+    }
+    assert len(lines) == len(batched) == 8
+    for line in lines:
+        color, width = batched[line.get_xydata().tobytes()]
+        np.testing.assert_allclose(color, to_rgba(line.get_color(), line.get_alpha()))
+        assert width == line.get_linewidth()
+
+
+def test_batched_lines_require_known_colors() -> None:
+    data = _grouped_lines(3, 5)
+
+    fm = FigureManager()
+    with pytest.raises(AssertionError, match="theme colors"):
+        fm.plot(data, "line", x="x", y="y", hue_by="g", color=None, batch_lines=True)
+
+
+def test_batched_lines_keep_best_legend_placement() -> None:
+    x = np.arange(50, dtype=float)
+    data = pd.DataFrame(
+        {
+            "x": np.tile(x, 3),
+            "y": np.concatenate([x, 1.5 * x, 2 * x]),
+            "opt": np.repeat(["adam", "sgd", "lion"], 50),
+        }
+    )
+
+    # The lines run through the upper right, so loc="best" must avoid it
+    # whether or not the groups share one collection.
+    extents = []
+    for batch_lines in (False, True):
+        fm = FigureManager()
+        fm.plot(
+            data,
+            "line",
+            x="x",
+            y="y",
+            hue_by="opt",
+            alpha=0.7,
+            linewidth=2,
+            batch_lines=batch_lines,
+        )
+        fm.finalize_layout()
+        fm.fig.canvas.draw()
+        extents.append(fm.get_axes(0, 0).get_legend().get_window_extent().bounds)
+    assert extents[0] == extents[1]
+
+
+def _drawn_points(ax: Any) -> list[np.ndarray]:
+    # Joins each group's streamed chunks back into one line, in draw order.
+    chunks: dict[tuple[float, ...], list[np.ndarray]] = {}
+    for line in ax.lines:
+        points = np.column_stack([line.get_xdata(), line.get_ydata()])
+        chunks.setdefault(to_rgba(line.get_color()), []).append(points)
+    for collection in ax.collections:
+        for path, color in zip(
+            collection.get_paths(), collection.get_edgecolors(), strict=True
+        ):
+            if len(path.vertices):
+                chunks.setdefault(tuple(color), []).append(path.vertices)
+    return [
+        np.concatenate([group[0], *(chunk[1:] for chunk in group[1:])])
+        for group in chunks.values()
+    ]
+
+
+@pytest.mark.parametrize("batch_lines", [False, True])
+def test_appends_extend_lines_across_calls(
+    batch_lines: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Small chunks make the appends below roll over into new artists and merge
+    # the out-of-order chunk across them.
+    monkeypatch.setattr(line_module, "STREAM_CHUNK_POINTS", 4)
+    arrays: list[np.ndarray] = []
+
+    def chunk(steps: list[int]) -> pd.DataFrame:
+        x = np.array(steps * 2, dtype=float)
+        y = np.concatenate([x[: len(steps)], -x[: len(steps)]])
+        arrays.extend([x, y])
+        # The frame wraps the caller's arrays without copying them.
+        frame = pd.DataFrame(
+            {"x": x, "y": y, "g": ["a"] * len(steps) + ["b"] * len(steps)},
+            copy=False,
+        )
+        assert np.shares_memory(frame["y"].to_numpy(), y)
+        return frame
+
+    fm = FigureManager()
+    fm.plot(chunk([0, 1, 2]), "line", x="x", y="y", hue_by="g", batch_lines=batch_lines)
+    seen = [0, 1, 2]
+    for steps in ([3, 4], [8, 9], [5, 6, 7], [10]):
+        fm.append(0, 0, chunk(steps))
+        # Data stays owned by the caller once plotted or appended.
+        for values in arrays:
+            values[:] = np.nan
+
+        seen = sorted(seen + steps)
+        expected = np.array(seen, dtype=float)
+        drawn = _drawn_points(fm.get_axes(0, 0))
+        for points, sign in zip(drawn, (1, -1), strict=True):
+            np.testing.assert_array_equal(points[:, 0], expected)
+            np.testing.assert_array_equal(points[:, 1], sign * expected)
+
+
+@pytest.mark.parametrize("batch_lines", [False, True])
+def test_append_cost_does_not_grow_with_history(
+    batch_lines: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    chunk_points = 50
+    monkeypatch.setattr(line_module, "STREAM_CHUNK_POINTS", chunk_points)
+    handed: list[int] = [0]
+    set_data = Line2D.set_data
+    set_verts = PolyCollection.set_verts
+
+    # Line2D copies the data it is given and PolyCollection converts every
+    # segment, so the points handed to either bound the work per append.
+    def counting_set_data(self: Line2D, *args: Any) -> None:
+        handed[-1] += len(args[0])
+        set_data(self, *args)
+
+    def counting_set_verts(
+        self: PolyCollection, verts: Any, *args: Any, **kwargs: Any
+    ) -> None:
+        handed[-1] += sum(len(segment) for segment in verts)
+        set_verts(self, verts, *args, **kwargs)
+
+    monkeypatch.setattr(Line2D, "set_data", counting_set_data)
+    monkeypatch.setattr(PolyCollection, "set_verts", counting_set_verts)
+
+    def chunk(start: int, size: int) -> pd.DataFrame:
+        x = np.arange(start, start + size, dtype=float)
+        return pd.DataFrame(
+            {"x": np.tile(x, 2), "y": np.tile(x, 2), "g": np.repeat(["a", "b"], size)}
+        )
+
+    fm = FigureManager()
+    fm.plot(chunk(0, 10), "line", x="x", y="y", hue_by="g", batch_lines=batch_lines)
+    steps = 400
+    for start in range(10, 10 + 5 * steps, 5):
+        handed.append(0)
+        fm.append(0, 0, chunk(start, 5))
+
+    # Each group ends with 2000 points of history, but no append hands the
+    # artists more than about one chunk per group.
+    per_append = handed[1:]
+    assert max(per_append) <= 2 * (chunk_points + 2 * 5)
+    assert max(per_append[-steps // 4 :]) <= max(per_append[: steps // 4])
+    expected = np.arange(10 + 5 * steps, dtype=float)
+    drawn = _drawn_points(fm.get_axes(0, 0))
+    assert len(drawn) == 2
+    for points in drawn:
+        np.testing.assert_array_equal(points[:, 0], expected)
+
+
+@pytest.mark.parametrize("strategy", ["figure", "grouped"])
+def test_appending_a_group_leaves_one_figure_legend(strategy: str) -> None:
+    data = _grouped_lines(2, 5)
+    chunk = pd.DataFrame({"x": [5, 6], "y": [0.5, 0.6], "g": ["new", "new"]})
+    config = PlotConfig(legend=LegendConfig(legend_strategy=strategy))
+
+    with FigureManager(config) as fm:
+        fm.plot(data, "line", x="x", y="y", hue_by="g")
+        fm.append(0, 0, chunk)
+    assert len(fm.fig.legends) == 1
+    assert [text.get_text() for text in fm.fig.legends[0].get_texts()] == [
+        "g000",
+        "g001",
+        "new",
+    ]
+
+    fm.append(0, 0, chunk.assign(g="newer"))
+    assert len(fm.fig.legends) == 1
+    assert fm.fig.legends[0].get_texts()[-1].get_text() == "newer"
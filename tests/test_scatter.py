@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import matplotlib as mpl
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.collections import Collection, PathCollection
+
+from dr_plotter import FigureManager
+from dr_plotter.plotters.scatter import BATCHED_POINTS_MIN_GROUPS
+
+mpl.use("Agg")
+
+
+def _grouped_points(n_groups: int, group_size: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "x": rng.random(n_groups * group_size),
+            "y": rng.random(n_groups * group_size),
+            "g": np.repeat([f"g{i:03d}" for i in range(n_groups)], group_size),
+        }
+    )
+
+
+def _draw_both_paths(
+    data: pd.DataFrame, batch_points: bool | None = True, **kwargs: Any
+) -> tuple[list[Collection], list[Collection]]:
+    # Both plots share one axes and style coordinator, so groups get the same
+    # styles on either path.
+    fm = FigureManager()
+    fm.plot(data, "scatter", x="x", y="y", hue_by="g", batch_points=False, **kwargs)
+    collections = fm.get_axes(0, 0).collections
+    per_group = list(collections)
+    fm.plot(
+        data, "scatter", x="x", y="y", hue_by="g", batch_points=batch_points, **kwargs
+    )
+    return per_group, list(collections[len(per_group) :])
+
+
+def _per_point(
+    collections: list[Collection], getter: Callable[[Collection], Any]
+) -> np.ndarray:
+    values = []
+    for collection in collections:
+        value = np.asarray(getter(collection))
+        count = len(collection.get_offsets())
+        values.append(np.broadcast_to(value, (count, *value.shape[1:])))
+    return np.concatenate(values)
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"linewidths": 2.5}, {"s": 30, "marker": "x"}])
+def test_batched_scatter_matches_per_group_properties(kwargs: dict[str, Any]) -> None:
+    per_group, batched = _draw_both_paths(_grouped_points(12, 4), **kwargs)
+
+    assert len(per_group) == 12
+    assert len(batched) == 1
+    for getter in (
+        Collection.get_offsets,
+        Collection.get_facecolors,
+        Collection.get_edgecolors,
+        Collection.get_linewidths,
+        PathCollection.get_sizes,
+    ):
+        np.testing.assert_allclose(
+            _per_point(batched, getter), _per_point(per_group, getter)
+        )
+
+
+def test_many_groups_batch_with_per_group_offsets_and_colors() -> None:
+    data = _grouped_points(BATCHED_POINTS_MIN_GROUPS + 1, 3)
+    per_group, batched = _draw_both_paths(data, batch_points=None)
+
+    (collection,) = batched
+    offsets = collection.get_offsets()
+    facecolors = collection.get_facecolors()
+    start = 0
+    for (_, group), group_collection in zip(data.groupby("g"), per_group, strict=True):
+        end = start + len(group)
+        np.testing.assert_allclose(offsets[start:end], group[["x", "y"]])
+        np.testing.assert_allclose(offsets[start:end], group_collection.get_offsets())
+        np.testing.assert_allclose(
+            facecolors[start:end],
+            np.repeat(group_collection.get_facecolors(), len(group), axis=0),
+        )
+        start = end
+    assert start == len(offsets)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.colors import to_rgba
+
+from dr_plotter import FigureManager
+from dr_plotter.tiled_rendering import TileMosaic
+
+mpl.use("Agg")
+
+DPI = 40
+
+
+@pytest.fixture
+def data() -> pd.DataFrame:
+    # Seed 1 only has dataset "a", so cells (1, 1) and (1, 2) stay empty.
+    cells = [(0, "a"), (0, "b"), (0, "c"), (1, "a")]
+    return pd.DataFrame(
+        {
+            "step": np.tile(np.arange(5), len(cells)),
+            "loss": np.linspace(0, 1, 5 * len(cells)),
+            "seed": np.repeat([seed for seed, _ in cells], 5),
+            "ds": np.repeat([ds for _, ds in cells], 5),
+        }
+    )
+
+
+def _canvas(fm: FigureManager) -> np.ndarray:
+    fm.fig.canvas.draw()
+    return np.asarray(fm.fig.canvas.buffer_rgba()).copy()
+
+
+def test_plot_tiled_places_tiles_like_plot(data: pd.DataFrame) -> None:
+    facets = {"x": "step", "y": "loss", "rows_by": "seed", "cols_by": "ds"}
+    fm = FigureManager()
+    fm.plot(data, "line", **facets)
+    drawn = {
+        (row, col)
+        for row in range(2)
+        for col in range(3)
+        if fm.get_axes(row, col).lines
+    }
+    assert drawn == {(0, 0), (0, 1), (0, 2), (1, 0)}
+
+    tiled = FigureManager()
+    tiled.plot_tiled(data, "line", processes=2, dpi=DPI, **facets)
+    (mosaic,) = [a for a in tiled.fig.get_children() if isinstance(a, TileMosaic)]
+
+    assert tiled.layout_config.figsize == fm.layout_config.figsize
+    # Tiles are rounded to whole pixels.
+    assert tuple(tiled.fig.get_size_inches()) == pytest.approx(
+        fm.fig.get_size_inches(), abs=2 / DPI
+    )
+    tile_height, rest = divmod(mosaic.image.shape[0], 2)
+    tile_width, rest_width = divmod(mosaic.image.shape[1], 3)
+    assert rest == rest_width == 0
+    background = np.asarray(to_rgba(plt.rcParams["figure.facecolor"])) * 255
+    for row in range(2):
+        for col in range(3):
+            tile = mosaic.image[
+                row * tile_height : (row + 1) * tile_height,
+                col * tile_width : (col + 1) * tile_width,
+            ]
+            assert (not np.all(tile == background)) == ((row, col) in drawn)
+
+    # At the tile dpi the mosaic is blitted unscaled at its rect.
+    canvas = _canvas(tiled)
+    height, width = mosaic.image.shape[:2]
+    left, bottom, _, _ = mosaic.rect
+    x0, y0 = (round(v) for v in tiled.fig.transFigure.transform((left, bottom)))
+    top = canvas.shape[0] - y0 - height
+    np.testing.assert_array_equal(
+        canvas[top : top + height, x0 : x0 + width], mosaic.image
+    )
+    plt.close(fm.fig)
+    plt.close(tiled.fig)
+
+
+def test_plot_tiled_without_a_pool_draws_like_plot(data: pd.DataFrame) -> None:
+    facets = {"x": "step", "y": "loss", "rows_by": "seed", "cols_by": "ds"}
+    fm = FigureManager()
+    fm.plot(data, "line", **facets)
+    fm.finalize_layout()
+
+    fallback = FigureManager()
+    fallback.plot_tiled(data, "line", processes=1, **facets)
+    fallback.finalize_layout()
+
+    assert not any(isinstance(a, TileMosaic) for a in fallback.fig.get_children())
+    np.testing.assert_array_equal(_canvas(fallback), _canvas(fm))
+    plt.close(fm.fig)
+    plt.close(fallback.fig)